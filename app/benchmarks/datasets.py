@@ -0,0 +1,94 @@
+try:
+    import os
+    import logging
+    from contextlib import contextmanager
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import Engine
+    from sqlalchemy_utils import database_exists, create_database, drop_database
+    from app.database import conn, generator
+    from app.env import getenv
+    from app.database.base import Base
+    from app.database.db_roles import execute_sql_file
+    from app import models # Registra todos os modelos no metadata antes do create_all
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+# Banco descartável dos benchmarks, criado no mesmo servidor do banco da aplicação
+BENCH_DATABASE = "%s_bench" % getenv("POSTGRES_DB", "human_resources_db")
+
+# Proporções do conjunto de dados: um departamento para cada 500 colaboradores, quatro cargos por departamento
+# (o primeiro de liderança), um usuário para cada dez colaboradores e 10% dos colaboradores arquivados.
+EMPLOYEES_PER_DEPARTMENT = 500
+JOBS_PER_DEPARTMENT = 4
+USERS_RATIO = 0.1
+ARCHIVED_RATIO = 0.1
+
+
+def create_bench_database() -> Engine:
+    """
+        Cria o banco descartável dos benchmarks com as tabelas e as regras do init.sql, caso ainda não exista.
+
+        Returns:
+            Engine: Engine síncrona do banco dos benchmarks.
+    """
+
+    engine = create_engine(conn.get_database_url().rsplit("/", 1)[0] + "/" + BENCH_DATABASE)
+    if not database_exists(engine.url):
+        create_database(engine.url)
+        Base.metadata.create_all(bind=engine)
+        execute_sql_file(engine, os.path.join(os.path.dirname(conn.__file__), "init.sql"))
+        _logger.info("Banco de benchmark %s criado!" % BENCH_DATABASE)
+    return engine
+
+def drop_bench_database(engine: Engine) -> None:
+    """
+        Remove o banco descartável dos benchmarks.
+    """
+
+    engine.dispose()
+    drop_database(engine.url)
+    _logger.info("Banco de benchmark %s removido!" % BENCH_DATABASE)
+
+def load_dataset(engine: Engine, employees: int, seed: int = 42) -> None:
+    """
+        Substitui os dados do banco de benchmark por um conjunto sintético com a quantidade de colaboradores
+        informada, carregado com COPY pelo gerador (app.database.generator).
+
+        Args:
+            engine: Engine síncrona do banco dos benchmarks.
+            employees: Quantidade de colaboradores (ativos e arquivados).
+            seed: Semente do conjunto gerado.
+    """
+
+    generator.truncate(engine)
+    generator.generate(
+        engine,
+        departments=max(1, employees // EMPLOYEES_PER_DEPARTMENT),
+        jobs_per_department=JOBS_PER_DEPARTMENT,
+        employees=employees,
+        users=int(employees * USERS_RATIO),
+        archived_ratio=ARCHIVED_RATIO,
+        seed=seed
+    )
+    _logger.info("Conjunto de dados com %s colaboradores carregado!" % employees)
+
+@contextmanager
+def use_bench_database():
+    """
+        Aponta as engines da aplicação para o banco dos benchmarks (sem réplica) enquanto o contexto estiver ativo.
+    """
+
+    previous = conn.POSTGRES_DB, conn.POSTGRES_REPLICA_HOST
+    conn.POSTGRES_DB, conn.POSTGRES_REPLICA_HOST = BENCH_DATABASE, None
+    conn.get_async_engine.cache_clear()
+    conn.get_read_engine.cache_clear()
+    try:
+        yield
+    finally:
+        conn.POSTGRES_DB, conn.POSTGRES_REPLICA_HOST = previous
+        conn.get_async_engine.cache_clear()
+        conn.get_read_engine.cache_clear()
@@ -0,0 +1,170 @@
+try:
+    import os
+    import re
+    import argparse
+    import time
+    from sqlalchemy import create_engine
+    from sqlalchemy.sql import text
+    from app.database.conn import get_database_url
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Schema temporário onde o benchmark cria as próprias tabelas, sem tocar nos dados da aplicação
+SCHEMA = "bench_sync_is_leader"
+
+# Versão anterior da trigger: reescreve is_leader de todos os colaboradores do departamento
+PREVIOUS_TRIGGER = """
+CREATE OR REPLACE FUNCTION {schema}.sync_is_leader()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE {schema}.employee
+    SET is_leader = (id = NEW.leader_id)
+    WHERE department_id = NEW.id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_is_leader
+AFTER UPDATE OF leader_id ON {schema}.department
+FOR EACH ROW EXECUTE FUNCTION {schema}.sync_is_leader();
+"""
+
+# Arquivo de onde a versão atual da trigger é lida, para que o benchmark meça exatamente o que está instalado
+INIT_SQL_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "database", "init.sql")
+
+
+def load_current_trigger() -> str:
+    """
+        Lê do init.sql a versão atual da função e da trigger sync_is_leader.
+
+        As tabelas não têm o schema no nome, então a trigger é criada e executada no schema do benchmark pelo
+        search_path das conexões (ver main).
+
+        Returns:
+            str: Trecho do init.sql com a função e a trigger.
+    """
+
+    with open(INIT_SQL_PATH, "r") as file:
+        match = re.search(
+            r"CREATE OR REPLACE FUNCTION sync_is_leader\(\).*?EXECUTE FUNCTION sync_is_leader\(\);",
+            file.read(),
+            re.DOTALL
+        )
+    if not match:
+        raise RuntimeError("Trigger sync_is_leader não encontrada em %s" % INIT_SQL_PATH)
+    return match.group(0)
+
+def setup_schema(engine, employees: int) -> None:
+    """
+        Cria o schema do benchmark com um único departamento contendo todos os colaboradores.
+
+        Args:
+            engine: Engine síncrona do banco de dados.
+            employees: Quantidade de colaboradores do departamento.
+    """
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA IF EXISTS %s CASCADE" % SCHEMA))
+        connection.execute(text("CREATE SCHEMA %s" % SCHEMA))
+        connection.execute(text(
+            "CREATE TABLE %s.department (id INTEGER PRIMARY KEY, leader_id INTEGER)" % SCHEMA
+        ))
+        connection.execute(text(
+            "CREATE TABLE %s.employee ("
+            "id INTEGER PRIMARY KEY, department_id INTEGER NOT NULL, is_leader BOOLEAN NOT NULL DEFAULT FALSE)"
+            % SCHEMA
+        ))
+        connection.execute(text("CREATE INDEX ON %s.employee (department_id)" % SCHEMA))
+        connection.execute(text("INSERT INTO %s.department (id, leader_id) VALUES (1, 1)" % SCHEMA))
+        connection.execute(
+            text("INSERT INTO %s.employee (id, department_id, is_leader) "
+                 "SELECT n, 1, n = 1 FROM generate_series(1, :employees) AS n" % SCHEMA),
+            {"employees": employees}
+        )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE %s.employee" % SCHEMA))
+
+def measure(engine, trigger_sql: str, employees: int, rounds: int) -> dict:
+    """
+        Instala uma versão da trigger e troca o líder do departamento várias vezes, medindo cada troca.
+
+        Cada troca é feita em uma transação própria. As linhas atualizadas e o volume de WAL vêm da diferença de
+        pg_stat_xact_user_tables e de pg_current_wal_insert_lsn antes e depois do UPDATE.
+
+        Args:
+            engine: Engine síncrona do banco de dados.
+            trigger_sql: Função e trigger que serão avaliadas.
+            employees: Quantidade de colaboradores do departamento.
+            rounds: Quantidade de trocas de líder.
+
+        Returns:
+            dict: Médias de linhas de employee reescritas, bytes de WAL e tempo por troca de líder.
+    """
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP TRIGGER IF EXISTS sync_is_leader ON %s.department" % SCHEMA))
+        connection.execute(text(trigger_sql))
+        connection.execute(text("UPDATE %s.department SET leader_id = 1" % SCHEMA))
+        connection.execute(text("UPDATE %s.employee SET is_leader = (id = 1) WHERE is_leader <> (id = 1)" % SCHEMA))
+
+    # Desde o PostgreSQL 15 a view também inclui as contagens de transações anteriores da mesma conexão que ainda não
+    # foram enviadas às estatísticas, então as linhas são a diferença antes e depois do UPDATE
+    updated_rows = text(
+        "SELECT COALESCE(SUM(n_tup_upd), 0) FROM pg_stat_xact_user_tables "
+        "WHERE schemaname = :schema AND relname = 'employee'"
+    )
+    rows, wal_bytes, elapsed = 0, 0, 0.0
+    for round_number in range(rounds):
+        new_leader = (round_number % (employees - 1)) + 2
+        with engine.begin() as connection:
+            rows_before = connection.execute(updated_rows, {"schema": SCHEMA}).scalar()
+            lsn_before = connection.execute(text("SELECT pg_current_wal_insert_lsn()")).scalar()
+            start = time.perf_counter()
+            connection.execute(
+                text("UPDATE %s.department SET leader_id = :leader WHERE id = 1" % SCHEMA),
+                {"leader": new_leader}
+            )
+            elapsed += time.perf_counter() - start
+            rows += connection.execute(updated_rows, {"schema": SCHEMA}).scalar() - rows_before
+            wal_bytes += connection.execute(
+                text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), :lsn)"),
+                {"lsn": lsn_before}
+            ).scalar()
+
+    return {
+        "rows": rows / rounds,
+        "wal_bytes": float(wal_bytes) / rounds,
+        "ms": elapsed * 1000 / rounds,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compara a amplificação de escrita da trigger sync_is_leader antes e depois da otimização."
+    )
+    parser.add_argument("--employees", type=int, default=20000, help="Colaboradores no departamento.")
+    parser.add_argument("--rounds", type=int, default=20, help="Quantidade de trocas de líder medidas.")
+    args = parser.parse_args()
+
+    # Os nomes sem schema da trigger atual (init.sql) apontam para as tabelas do benchmark
+    engine = create_engine(get_database_url(), connect_args={"options": "-c search_path=%s" % SCHEMA})
+    try:
+        setup_schema(engine, args.employees)
+        results = {
+            "anterior": measure(engine, PREVIOUS_TRIGGER.format(schema=SCHEMA), args.employees, args.rounds),
+            "atual": measure(engine, load_current_trigger(), args.employees, args.rounds),
+        }
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text("DROP SCHEMA IF EXISTS %s CASCADE" % SCHEMA))
+        engine.dispose()
+
+    print("Troca de líder em um departamento com %s colaboradores (média de %s trocas)" % (
+        args.employees, args.rounds))
+    print("%-10s %15s %15s %12s" % ("trigger", "linhas/troca", "WAL bytes", "ms/troca"))
+    for name, result in results.items():
+        print("%-10s %15.1f %15.0f %12.2f" % (name, result["rows"], result["wal_bytes"], result["ms"]))
+
+
+if __name__ == "__main__":
+    main()
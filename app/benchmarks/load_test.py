@@ -0,0 +1,262 @@
+try:
+    import json
+    import time
+    import random
+    import asyncio
+    import argparse
+    import platform
+    from collections import Counter, defaultdict
+    from typing import Dict, List, Optional
+    import httpx
+    from app.benchmarks.percentiles import percentile
+    from app.database.demo_data import fake, fake_employee_payload
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Mistura padrão do tráfego (pesos relativos): maioria de consultas ao cadastro e uma parcela de escritas
+OPERATIONS = ("list", "get", "search", "promote", "create", "archive")
+DEFAULT_MIX = "list=30,get=30,search=15,promote=10,create=10,archive=5"
+
+# Prefixo das matrículas criadas pelo teste de carga. O gerador de dados usa matrículas só com dígitos (o ID com
+# 9 casas), e o horário de início no prefixo evita colisões com os colaboradores de execuções anteriores.
+REGISTER_PREFIX = "LT%s-"
+
+SEARCH_TERMS = ("Silva", "Santos", "Oliveira", "Souza", "Ana", "Maria", "João", "Pedro", "Costa", "Lima")
+
+
+class LoadTest:
+    """
+        Gera carga HTTP contra a API com uma mistura configurável de operações de RH.
+
+        Os colaboradores usados nas leituras e promoções são amostrados da própria API no início. Os arquivamentos
+        são feitos apenas em colaboradores criados durante a execução, para não alterar os dados existentes.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, int], seed: int):
+        self.client = client
+        self.random = random.Random(seed)
+        fake.seed_instance(seed)
+        self.register_prefix = REGISTER_PREFIX % int(time.time())
+        self.operations = list(mix)
+        self.weights = [mix[operation] for operation in self.operations]
+        self.employee_ids: List[int] = []
+        self.job_ids: List[int] = []
+        self.created_ids: List[int] = []
+        self.latencies = defaultdict(list)
+        self.status_codes = defaultdict(Counter)
+
+    async def prepare(self) -> None:
+        """
+            Amostra os colaboradores e os cargos usados pelas operações.
+
+            Os cargos das criações são os de colaboradores que não são líderes, ou seja, cargos sem liderança,
+            que aceitam vários colaboradores.
+        """
+
+        response = await self.client.get("/employees/", params={"limit": 1000})
+        response.raise_for_status()
+        employees = response.json()["items"]
+        if not employees:
+            raise SystemExit("Nenhum colaborador ativo para gerar a carga.")
+        self.employee_ids = [employee["id"] for employee in employees]
+
+        # A resposta não traz o is_leader, os colaboradores que não são líderes vêm do filtro da listagem
+        response = await self.client.get("/employees/", params={"limit": 1000, "is_leader": False})
+        response.raise_for_status()
+        self.job_ids = sorted({employee["job_id"] for employee in response.json()["items"]})
+        if not self.job_ids:
+            raise SystemExit("Nenhum cargo sem liderança encontrado para os cadastros.")
+
+    def next_operation(self) -> str:
+        return self.random.choices(self.operations, self.weights)[0]
+
+    async def execute(self, operation: str, scheduled: Optional[float] = None) -> None:
+        """
+            Executa uma operação e registra a latência e o status na rota correspondente.
+
+            Com taxa fixa, a latência é contada a partir do momento em que a requisição deveria ter saído,
+            incluindo a espera por uma vaga de concorrência.
+        """
+
+        method, route, url, payload = self.build_request(operation)
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            response = await self.client.request(method, url, json=payload)
+            status = response.status_code
+        except httpx.HTTPError as error:
+            response, status = None, type(error).__name__
+        label = "%s %s" % (method, route)
+        self.latencies[label].append(time.perf_counter() - start)
+        self.status_codes[label][str(status)] += 1
+
+        if operation == "create" and response is not None and response.status_code == 200:
+            self.created_ids.append(response.json()["id"])
+
+    def build_request(self, operation: str) -> tuple:
+        """
+            Monta a requisição de uma operação.
+
+            A listagem e o cadastro usam /employees/ com a barra final, a rota do roteador. Sem ela a API responde
+            com um redirecionamento (307), que o httpx não segue.
+
+            Returns:
+                tuple: Método, rota (para o relatório), URL e corpo da requisição.
+        """
+
+        if operation == "archive" and not self.created_ids:
+            operation = "create"
+        if operation == "list":
+            url = "/employees/?limit=50&after_id=%s" % self.random.choice(self.employee_ids)
+            return "GET", "/employees", url, None
+        if operation == "get":
+            return "GET", "/employees/{id}", "/employees/%s" % self.random.choice(self.employee_ids), None
+        if operation == "search":
+            return "GET", "/employees/search", "/employees/search?q=%s" % self.random.choice(SEARCH_TERMS), None
+        if operation == "promote":
+            url = "/employees/%s/promote" % self.random.choice(self.employee_ids)
+            return "PUT", "/employees/{id}/promote", url, {"salary": round(self.random.uniform(1500, 10000), 2)}
+        if operation == "create":
+            return "POST", "/employees", "/employees/", fake_employee_payload(
+                self.random.choice(self.job_ids), self.register_prefix)
+        if operation == "archive":
+            url = "/employees/%s/archive" % self.created_ids.pop(self.random.randrange(len(self.created_ids)))
+            return "PUT", "/employees/{id}/archive", url, None
+        raise ValueError("Operação desconhecida: %s" % operation)
+
+    async def run_closed(self, concurrency: int, duration: float) -> None:
+        """
+            Concorrência fixa: cada worker envia a próxima requisição assim que recebe a resposta da anterior.
+        """
+
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self.execute(self.next_operation())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def run_open(self, rate: float, concurrency: int, duration: float) -> None:
+        """
+            Taxa de chegada fixa: as requisições são disparadas em intervalos regulares, independente das respostas,
+            limitadas a `concurrency` requisições simultâneas.
+        """
+
+        slots = asyncio.Semaphore(concurrency)
+        start = time.perf_counter()
+        tasks = []
+
+        async def send(operation: str, scheduled: float):
+            async with slots:
+                await self.execute(operation, scheduled)
+
+        for index in range(int(rate * duration)):
+            scheduled = start + index / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(self.next_operation(), scheduled)))
+        await asyncio.gather(*tasks)
+
+    def report(self, elapsed: float) -> dict:
+        """
+            Monta o relatório com vazão, percentis de latência e taxa de erros por rota.
+        """
+
+        routes = {}
+        for label, latencies in sorted(self.latencies.items()):
+            latencies.sort()
+            errors = sum(count for status, count in self.status_codes[label].items() if not status.startswith(("2", "3")))
+            routes[label] = {
+                "requests": len(latencies),
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "error_rate": round(errors / len(latencies), 4),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                "p999_ms": round(percentile(latencies, 99.9) * 1000, 2),
+                "status_codes": dict(self.status_codes[label]),
+            }
+        total = sum(route["requests"] for route in routes.values())
+        errors = sum(route["requests"] * route["error_rate"] for route in routes.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "requests": total,
+            "throughput_rps": round(total / elapsed, 2),
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "routes": routes,
+        }
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    """
+        Converte a mistura de operações ("list=30,get=30,...") em um dicionário de pesos.
+    """
+
+    weights = {}
+    for item in mix.split(","):
+        operation, _, weight = item.partition("=")
+        if operation.strip() not in OPERATIONS:
+            raise SystemExit("Operação desconhecida: %s. Opções válidas: %s" % (operation, ", ".join(OPERATIONS)))
+        weights[operation.strip()] = int(weight)
+    return {operation: weight for operation, weight in weights.items() if weight > 0}
+
+async def run(args) -> dict:
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        load_test = LoadTest(client, mix, args.seed)
+        await load_test.prepare()
+        start = time.perf_counter()
+        if args.rate:
+            await load_test.run_open(args.rate, args.concurrency, args.duration)
+        else:
+            await load_test.run_closed(args.concurrency, args.duration)
+        report = load_test.report(time.perf_counter() - start)
+
+    report["config"] = {
+        "base_url": args.base_url,
+        "mode": "rate" if args.rate else "concurrency",
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "mix": mix,
+        "seed": args.seed,
+        "label": args.label,
+        "host": platform.node(),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Teste de carga HTTP da API com uma mistura de consultas, promoções, arquivamentos e cadastros."
+    )
+    parser.add_argument("--base-url", default="http://localhost:5555", help="Endereço da API.")
+    parser.add_argument("--duration", type=float, default=60, help="Duração da carga, em segundos.")
+    parser.add_argument("--concurrency", type=int, default=20,
+                        help="Requisições simultâneas (no modo de taxa fixa, o limite de requisições em andamento).")
+    parser.add_argument("--rate", type=float, help="Taxa fixa de chegada em requisições por segundo.")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="Pesos das operações list, get, search, promote, create e archive.")
+    parser.add_argument("--timeout", type=float, default=30, help="Tempo limite de cada requisição, em segundos.")
+    parser.add_argument("--seed", type=int, default=42, help="Semente da escolha das operações e dos dados gerados.")
+    parser.add_argument("--label", help="Identificação da execução no relatório (ex.: configuração do pool).")
+    parser.add_argument("--report", help="Arquivo JSON onde o relatório é gravado.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print("%s requisições em %.1fs: %.1f req/s, %.2f%% de erros" % (
+        report["requests"], report["elapsed_s"], report["throughput_rps"], report["error_rate"] * 100))
+    print("%-32s %9s %9s %9s %9s %9s" % ("rota", "req/s", "erros %", "p50 ms", "p99 ms", "p999 ms"))
+    for label, route in report["routes"].items():
+        print("%-32s %9.1f %9.2f %9.1f %9.1f %9.1f" % (
+            label, route["throughput_rps"], route["error_rate"] * 100, route["p50_ms"], route["p99_ms"],
+            route["p999_ms"]))
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+try:
+    import argparse
+    import asyncio
+    import time
+    from sqlalchemy import event, select
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.database.conn import AsyncSessionLocal, get_database_url
+    from app.models.employee import Employee as EmployeeModel
+    from app.database import crud
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+async def _select_lookup(db, employee_id: int):
+    """
+        Busca anterior: monta e executa um novo SELECT a cada chamada.
+    """
+
+    return await db.scalar(
+        select(EmployeeModel)
+        .where(EmployeeModel.id == employee_id)
+        .options(*crud._employee_load_options(()))
+    )
+
+async def _get_lookup(db, employee_id: int):
+    """
+        Busca atual (crud.get_employee_by_id): db.get com a instrução compilada em cache.
+    """
+
+    return await crud.get_employee_by_id(db, employee_id)
+
+LOOKUPS = {
+    "select": _select_lookup,
+    "get": _get_lookup,
+}
+
+
+def track_database_time(engine) -> dict:
+    """
+        Registra o tempo gasto dentro do driver (envio da instrução e espera pelo banco) em cada execução.
+
+        Args:
+            engine: Engine assíncrona medida.
+
+        Returns:
+            dict: Acumulador com o tempo total no driver, em segundos.
+    """
+
+    timer = {"seconds": 0.0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        timer["seconds"] += time.perf_counter() - conn.info.pop("query_start")
+
+    return timer
+
+async def measure(statement_cache_size: int, lookup: str, ids: list) -> dict:
+    """
+        Faz uma busca por ID para cada ID informado, cada uma em uma sessão nova (como em uma requisição).
+
+        O tempo dentro do driver é descontado do tempo total, o que sobra é o custo em Python de cada busca:
+        montagem e compilação da instrução, sessão e carregamento do objeto.
+
+        Args:
+            statement_cache_size: Tamanho do cache de instruções preparadas do asyncpg (0 desativa).
+            lookup: Forma de busca, uma das chaves de LOOKUPS.
+            ids: IDs dos colaboradores buscados.
+
+        Returns:
+            dict: Tempo médio total, no driver e em Python por busca, em microssegundos.
+    """
+
+    engine = create_async_engine(
+        "%s?prepared_statement_cache_size=%s" % (get_database_url("postgresql+asyncpg"), statement_cache_size),
+        pool_size=1,
+        max_overflow=0
+    )
+    timer = track_database_time(engine)
+    try:
+        # Aquecimento: abre a conexão e popula os caches antes da medição
+        async with AsyncSessionLocal(bind=engine) as db:
+            await LOOKUPS[lookup](db, ids[0])
+        timer["seconds"] = 0.0
+
+        start = time.perf_counter()
+        for employee_id in ids:
+            async with AsyncSessionLocal(bind=engine) as db:
+                await LOOKUPS[lookup](db, employee_id)
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.dispose()
+
+    return {
+        "total_us": elapsed * 1e6 / len(ids),
+        "database_us": timer["seconds"] * 1e6 / len(ids),
+        "python_us": (elapsed - timer["seconds"]) * 1e6 / len(ids),
+    }
+
+async def run(lookups: int, statement_cache_size: int) -> dict:
+    engine = create_async_engine(get_database_url("postgresql+asyncpg"))
+    try:
+        async with AsyncSessionLocal(bind=engine) as db:
+            ids = list(await db.scalars(select(EmployeeModel.id).order_by(EmployeeModel.id).limit(lookups)))
+    finally:
+        await engine.dispose()
+    if not ids:
+        raise SystemExit("Nenhum colaborador cadastrado para o benchmark.")
+    ids = (ids * (lookups // len(ids) + 1))[:lookups]
+
+    results = {}
+    for cache_size in (0, statement_cache_size):
+        for lookup in LOOKUPS:
+            results[(lookup, cache_size)] = await measure(cache_size, lookup, ids)
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Mede o custo por busca de colaborador pelo ID, comparando o SELECT montado a cada chamada "
+                    "com db.get, com e sem o cache de instruções preparadas do asyncpg."
+    )
+    parser.add_argument("--lookups", type=int, default=2000, help="Quantidade de buscas por cenário.")
+    parser.add_argument("--statement-cache-size", type=int, default=100,
+                        help="Tamanho do cache de instruções preparadas comparado com o cache desativado.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.lookups, args.statement_cache_size))
+
+    print("Busca de colaborador pelo ID (média de %s buscas, uma sessão por busca)" % args.lookups)
+    print("%-8s %14s %12s %12s %12s" % ("busca", "cache asyncpg", "total µs", "banco µs", "python µs"))
+    for (lookup, cache_size), result in results.items():
+        print("%-8s %14s %12.1f %12.1f %12.1f" % (
+            lookup, cache_size, result["total_us"], result["database_us"], result["python_us"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+try:
+    from typing import List
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+        Percentil por interpolação linear de uma lista já ordenada.
+
+        Args:
+            values: Valores em ordem crescente.
+            p: Percentil desejado, de 0 a 100.
+
+        Returns:
+            float: Valor do percentil.
+    """
+
+    position = (len(values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
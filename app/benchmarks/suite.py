@@ -0,0 +1,314 @@
+try:
+    import os
+    import sys
+    import json
+    import time
+    import random
+    import argparse
+    import tracemalloc
+    import anyio
+    from urllib.parse import urlencode
+    from typing import Callable, Dict, List, Optional
+    from fastapi.testclient import TestClient
+    from sqlalchemy.sql import text
+    from app.benchmarks.percentiles import percentile
+    from app.benchmarks.datasets import create_bench_database, drop_bench_database, load_dataset, use_bench_database
+    from app.database import conn, crud
+    from app.schemas.employee import EmployeeFilter, SalaryAdjustment
+    from app.main import app
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+# Métricas comparadas com o baseline. Um caso é considerado regressão quando alguma delas passa
+# do valor do baseline multiplicado por (1 + tolerância).
+COMPARED_METRICS = ("p95_ms", "alloc_kb")
+
+# Casos que percorrem a tabela inteira, medidos com menos repetições
+FULL_SCAN_CASES = ("GET /employees/export",)
+
+
+class Bench:
+    """
+        Executa os casos do benchmark sobre um conjunto de dados já carregado.
+
+        As rotas são chamadas em processo pelo TestClient e as funções do crud são executadas no mesmo event loop
+        da aplicação (o portal do TestClient), com uma sessão nova por chamada, como em uma requisição.
+    """
+
+    def __init__(self, client: TestClient, iterations: int, warmup: int, seed: int):
+        self.client = client
+        self.iterations = iterations
+        self.warmup = warmup
+        self.random = random.Random(seed)
+
+        self.employees = self.crud(sample_employees)
+
+    def crud(self, function: Callable, *args):
+        """
+            Executa uma função do crud em uma sessão nova, no event loop da aplicação.
+        """
+
+        async def call():
+            async with conn.new_session() as db:
+                return await function(db, *args)
+
+        return self.client.portal.call(call)
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+            Faz uma requisição pelo TestClient, falhando se a resposta não for de sucesso.
+        """
+
+        response = self.client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError("%s %s: %s %s" % (method, url, response.status_code, response.text))
+        return response
+
+    def stream(self, url: str, **params) -> int:
+        """
+            Faz uma requisição GET direto na aplicação (ASGI), descartando cada parte do corpo assim que ela é enviada,
+            como um cliente que lê a resposta em streaming. O TestClient acumula o corpo inteiro em memória, e a
+            alocação medida seria o tamanho da resposta e não o pico do servidor durante o streaming.
+
+            Returns:
+                int: Tamanho do corpo da resposta, em bytes.
+        """
+
+        async def call():
+            status, size, request_sent, finished = None, 0, False, anyio.Event()
+
+            async def receive():
+                nonlocal request_sent
+                if not request_sent:
+                    request_sent = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                # O cliente só se desconecta depois de receber a resposta inteira
+                await finished.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                nonlocal status, size
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                    if not message.get("more_body", False):
+                        finished.set()
+
+            await self.client.app({
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": url,
+                "raw_path": url.encode(),
+                "query_string": urlencode(params).encode(),
+                "root_path": "",
+                "headers": [(b"host", b"testserver")],
+                "client": ("testclient", 50000),
+                "server": ("testserver", 80),
+                "state": self.client.app_state.copy(),
+            }, receive, send)
+            if status >= 400:
+                raise RuntimeError("GET %s: %s" % (url, status))
+            return size
+
+        return self.client.portal.call(call)
+
+    def employee(self) -> tuple:
+        return self.random.choice(self.employees)
+
+    def cases(self) -> Dict[str, Callable[[], object]]:
+        """
+            Casos medidos. Cada caso é uma chamada sem argumentos, os parâmetros são sorteados a cada execução.
+        """
+
+        return {
+            "crud.get_all_employees": lambda: self.crud(crud.get_all_employees),
+            "crud.get_all_employees[department]": lambda: self.crud(
+                crud.get_all_employees, crud.DEFAULT_PAGE_SIZE, None, (),
+                EmployeeFilter(department_id=self.employee()[1])),
+            "crud.search_employees": lambda: self.crud(crud.search_employees, "Marcs Silva"),
+            "crud.get_employee_by_id": lambda: self.crud(crud.get_employee_by_id, self.employee()[0]),
+            "crud.get_department_stats": lambda: self.crud(crud.get_department_stats, self.employee()[1]),
+            "crud.adjust_salaries[dry_run]": lambda: self.crud(crud.adjust_salaries, SalaryAdjustment(
+                mode="percentage", value=5, filters={"department_id": self.employee()[1]}, dry_run=True)),
+            "GET /employees": lambda: self.request("GET", "/employees"),
+            "GET /employees[filter,expand]": lambda: self.request("GET", "/employees", params={
+                "department_id": self.employee()[1], "expand": "job,department"}),
+            "GET /employees/search": lambda: self.request("GET", "/employees/search", params={"q": "Marcs Silva"}),
+            "GET /employees/{id}": lambda: self.request("GET", "/employees/%s" % self.employee()[0]),
+            "GET /departments/{id}/stats": lambda: self.request(
+                "GET", "/departments/%s/stats" % self.employee()[1]),
+            "PUT /employees/{id}/promote": lambda: self.request(
+                "PUT", "/employees/%s/promote" % self.employee()[0],
+                json={"salary": round(self.random.uniform(1500, 10000), 2)}),
+            "POST /employees": self.create_employee,
+            "GET /employees/export": lambda: self.stream("/employees/export"),
+        }
+
+    def create_employee(self):
+        """
+            Cria um colaborador e o remove em seguida, medindo apenas a criação.
+        """
+
+        start = time.perf_counter()
+        response = self.request("POST", "/employees", json={
+            "name": "Benchmark",
+            "last_name": "Silva",
+            "register_number": "B%s" % time.perf_counter_ns(),
+            "job_id": 2,
+            "salary": 5000.0,
+        })
+        elapsed = time.perf_counter() - start
+        self.request("DELETE", "/employees/%s" % response.json()["id"])
+        return elapsed
+
+    def measure(self, case: Callable[[], object], iterations: int) -> dict:
+        """
+            Mede a latência (percentis) e a alocação de memória de um caso. Casos que medem apenas parte
+            da chamada devolvem o próprio tempo, em segundos.
+
+            A alocação é medida em uma segunda passada com o tracemalloc ativo, para que o custo do rastreamento
+            não entre nos tempos. O valor é o pico de memória alocada durante uma chamada, em KiB.
+        """
+
+        for _ in range(min(self.warmup, iterations)):
+            case()
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            result = case()
+            elapsed = time.perf_counter() - start
+            timings.append(result if isinstance(result, float) else elapsed)
+
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(max(1, iterations // 10)):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                case()
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+
+        timings.sort()
+        return {
+            "iterations": iterations,
+            "p50_ms": round(percentile(timings, 50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 95) * 1000, 3),
+            "p99_ms": round(percentile(timings, 99) * 1000, 3),
+            "alloc_kb": round(sum(peaks) / len(peaks) / 1024, 1),
+        }
+
+    def run(self, only: Optional[List[str]] = None) -> dict:
+        results = {}
+        for name, case in self.cases().items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            iterations = max(3, self.iterations // 50) if name in FULL_SCAN_CASES else self.iterations
+            result = results[name] = self.measure(case, iterations)
+            print("  %-40s p50 %9.2f ms  p95 %9.2f ms  p99 %9.2f ms  %9.1f KiB" % (
+                name, result["p50_ms"], result["p95_ms"], result["p99_ms"], result["alloc_kb"]))
+        return results
+
+
+async def sample_employees(db) -> List[tuple]:
+    """
+        IDs e departamentos dos colaboradores usados como parâmetros dos casos.
+    """
+
+    rows = await db.execute(text("SELECT id, department_id FROM employee ORDER BY id LIMIT 1000"))
+    return [tuple(row) for row in rows]
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+        Compara os resultados com o baseline.
+
+        Returns:
+            List[str]: Descrição de cada regressão encontrada. Um caso ou tamanho ausente do baseline também é
+            uma falha, para que um baseline incompleto não aprove qualquer resultado.
+    """
+
+    regressions = []
+    for size, cases in results.items():
+        for name, result in cases.items():
+            reference = baseline.get(size, {}).get(name)
+            if not reference:
+                regressions.append("%s colaboradores, %s: ausente do baseline (grave com --update-baseline)" % (
+                    size, name))
+                continue
+            for metric in COMPARED_METRICS:
+                if reference[metric] and result[metric] > reference[metric] * (1 + tolerance):
+                    regressions.append("%s colaboradores, %s: %s %.2f > baseline %.2f" % (
+                        size, name, metric, result[metric], reference[metric]))
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark das funções do crud e das rotas da API sobre conjuntos de dados sintéticos, "
+                    "comparado com o baseline em app/benchmarks/baseline.json."
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Quantidades de colaboradores separadas por vírgula.")
+    parser.add_argument("--iterations", type=int, default=200, help="Repetições medidas por caso.")
+    parser.add_argument("--warmup", type=int, default=20, help="Repetições de aquecimento por caso.")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do sorteio dos parâmetros.")
+    parser.add_argument("--only", action="append", help="Executa apenas os casos que contêm o texto informado.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Aumento aceito em relação ao baseline antes de considerar regressão.")
+    parser.add_argument("--update-baseline", action="store_true", help="Grava os resultados como o novo baseline.")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados são gravados.")
+    parser.add_argument("--keep-database", action="store_true", help="Não remove o banco de benchmark ao final.")
+    args = parser.parse_args()
+
+    engine = create_bench_database()
+    results = {}
+    try:
+        for size in [int(size) for size in args.sizes.split(",")]:
+            load_dataset(engine, size)
+            print("%s colaboradores" % size)
+            with use_bench_database(), TestClient(app) as client:
+                try:
+                    results[str(size)] = Bench(client, args.iterations, args.warmup, args.seed).run(args.only)
+                finally:
+                    client.portal.call(conn.get_async_engine().dispose)
+    finally:
+        if args.keep_database:
+            engine.dispose()
+        else:
+            drop_bench_database(engine)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)
+
+    if args.update_baseline:
+        for size, cases in results.items():
+            baseline.setdefault(size, {}).update(cases)
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print("Baseline atualizado em %s" % BASELINE_PATH)
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print("REGRESSÃO: %s" % regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,4 @@ from . import conn
 from . import crud
 from . import demo_data
 from . import base
-from . import listen
\ No newline at end of file
+from . import pool
\ No newline at end of file
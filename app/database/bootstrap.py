@@ -0,0 +1,93 @@
+try:
+    import os
+    import time
+    import logging
+    from app.env import getenv
+    from app.database.base import Base
+    from app.database.conn import get_database_url
+    from app.database.demo_data import seed_data
+    from app.database.db_roles import execute_sql_file
+    from app import models # Registra todos os modelos no metadata antes do create_all
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy_utils import database_exists, create_database
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+# Tentativas de conexão enquanto o PostgreSQL ainda está subindo, com espera exponencial entre elas
+DB_BOOTSTRAP_RETRIES = int(getenv("DB_BOOTSTRAP_RETRIES", "10"))
+DB_BOOTSTRAP_BACKOFF = float(getenv("DB_BOOTSTRAP_BACKOFF", "0.5"))
+DB_BOOTSTRAP_MAX_BACKOFF = 10.0
+
+
+def wait_for_database(engine, retries: int = DB_BOOTSTRAP_RETRIES, backoff: float = DB_BOOTSTRAP_BACKOFF) -> bool:
+    """
+        Aguarda o servidor do PostgreSQL aceitar conexões, tentando novamente com espera exponencial.
+
+        Args:
+            engine: Engine síncrona do banco de dados.
+            retries: Quantidade máxima de tentativas.
+            backoff: Espera inicial, em segundos, entre as tentativas.
+
+        Returns:
+            bool: Se o banco de dados da aplicação já existe.
+
+        Raises:
+            OperationalError: Se o servidor não responder após todas as tentativas.
+    """
+
+    for attempt in range(1, retries + 1):
+        try:
+            return database_exists(engine.url)
+        except OperationalError as error:
+            if attempt == retries:
+                raise
+            delay = min(backoff * 2 ** (attempt - 1), DB_BOOTSTRAP_MAX_BACKOFF)
+            _logger.warning("Banco de dados indisponível (tentativa %s de %s), nova tentativa em %.1fs: %s" % (
+                attempt, retries, delay, error))
+            time.sleep(delay)
+
+def bootstrap() -> None:
+    """
+        Prepara o banco de dados da aplicação: cria o banco, as tabelas, as regras do init.sql e os dados
+        de demonstração caso o banco ainda não exista.
+
+        Deve ser executado uma vez antes de subir os workers (python -m app.database.bootstrap), assim
+        nenhum processo da API acessa o banco durante a importação.
+    """
+
+    engine = create_engine(get_database_url())
+    try:
+        if wait_for_database(engine): # Faz a verificação se a DB já existe no banco.
+            _logger.info("Banco de dados já existe!")
+            return
+
+        create_database(engine.url) # Se não existe, a DB é criada.
+        _logger.info("Banco de dados criado com sucesso!")
+
+        Base.metadata.create_all(bind=engine)
+        _logger.info("Tabelas criadas com sucesso!")
+
+        # Adiciona regras ao banco à partir do arquivo init.sql
+        sql_file_path = os.path.join(os.path.dirname(__file__), "init.sql")
+        try:
+            execute_sql_file(engine, sql_file_path)
+        except Exception as e:
+            _logger.error(f"Erro ao executar o arquivo SQL: %s" % e)
+            raise
+
+        # Inserir dados de demonstração
+        with sessionmaker(autocommit=False, autoflush=False, bind=engine)() as db:
+            seed_data(db)
+            _logger.info("Dados de demonstração inseridos com sucesso!")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    bootstrap()
@@ -1,16 +1,14 @@
 try:
     import time
-    import os
     import logging
-    from app.database.base import Base
-    from app.database.demo_data import seed_data
-    from app.database.db_roles import execute_sql_file
-    from sqlalchemy import create_engine
-    from sqlalchemy.ext.declarative import declarative_base
-    from sqlalchemy.orm import sessionmaker
-    from sqlalchemy_utils import database_exists, create_database
-    from sqlalchemy.orm import configure_mappers
-    from sqlalchemy.sql import text
+    from functools import lru_cache
+    from typing import Optional
+    from fastapi import Request, Response
+    from app.env import getenv
+    from app.database.pool import MonitoredQueuePool
+    from app.monitoring.queries import record_statement
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
@@ -18,62 +16,223 @@ except Exception as error:
 logging.basicConfig(level=logging.INFO)
 _logger = logging.getLogger(__name__)
 
-# Esse time sleep evita que o app tente criar as tabelas antes do banco de dados estar pronto.
-time.sleep(5)
+POSTGRES_USER = getenv("POSTGRES_USER")
+POSTGRES_PASSWORD = getenv("POSTGRES_PASSWORD")
+POSTGRES_DB = getenv("POSTGRES_DB")
+POSTGRES_HOST = getenv("POSTGRES_HOST")
+POSTGRES_PORT = getenv("POSTGRES_PORT")
 
-POSTGRES_USER = os.getenv("POSTGRES_USER")
-POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
-POSTGRES_DB = os.getenv("POSTGRES_DB")
-POSTGRES_HOST = os.getenv("POSTGRES_HOST")
-POSTGRES_PORT = os.getenv("POSTGRES_PORT")
+# Configuração do pool de conexões das requisições (por worker do uvicorn)
+DB_POOL_SIZE = int(getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
 
-if not all([POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB]):
-    raise ValueError("As variáveis de ambiente POSTGRES_USER, POSTGRES_PASSWORD ou POSTGRES_DB não estão definidas.")
+# Cache das instruções compiladas pelo SQLAlchemy (por engine) e das instruções preparadas no servidor
+# pelo asyncpg (por conexão). Uma consulta repetida não é compilada nem preparada novamente.
+DB_QUERY_CACHE_SIZE = int(getenv("DB_QUERY_CACHE_SIZE", "500"))
+DB_STATEMENT_CACHE_SIZE = int(getenv("DB_STATEMENT_CACHE_SIZE", "100"))
 
-DB_URL = "postgresql://%s:%s@%s:%s/%s" % (
-    POSTGRES_USER,
-    POSTGRES_PASSWORD,
-    POSTGRES_HOST,
-    POSTGRES_PORT,
-    POSTGRES_DB,
-)
+# Réplica de leitura opcional (mesmo usuário, senha e banco do primário). Sem ela, as leituras usam o primário.
+POSTGRES_REPLICA_HOST = getenv("POSTGRES_REPLICA_HOST")
+POSTGRES_REPLICA_PORT = getenv("POSTGRES_REPLICA_PORT", POSTGRES_PORT)
 
-engine = create_engine(DB_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-configure_mappers() # Configura os listens no banco de dados
+# Após uma escrita, as leituras do mesmo cliente vão para o primário durante esta janela (em segundos),
+# para que ele veja a própria alteração mesmo com atraso na replicação. Com 0 a janela é desativada.
+DB_READ_YOUR_WRITES_SECONDS = int(getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+PRIMARY_PIN_COOKIE = "db_primary_until"
 
-if not database_exists(engine.url): # Faz a verificação se a DB já existe no banco.
-    create_database(engine.url) # Se não existe, a DB é criada.
-    _logger.info("Banco de dados criado com sucesso!")
+# Fábrica das sessões das requisições. A engine é associada a cada sessão no momento em que ela é aberta,
+# com expire_on_commit=False os objetos continuam legíveis após o commit, já que no modo assíncrono
+# não é possível recarregar atributos de forma implícita.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
-    Base.metadata.create_all(bind=engine)
-    _logger.info("Tabelas criadas com sucesso!")
 
-    # Adiciona regras ao banco à partir do arquivo init.sql
-    sql_file_path = os.path.join(os.path.dirname(__file__), "init.sql")
+def get_database_url(driver: str = "postgresql", host: Optional[str] = None, port: Optional[str] = None) -> str:
+    """
+        Monta a URL de conexão com o banco a partir das variáveis de ambiente.
+
+        Args:
+            driver: Dialeto e driver do SQLAlchemy, por exemplo "postgresql" ou "postgresql+asyncpg".
+            host: Servidor do banco, por padrão POSTGRES_HOST.
+            port: Porta do banco, por padrão POSTGRES_PORT.
+
+        Returns:
+            str: URL de conexão com o banco de dados.
+
+        Raises:
+            ValueError: Se as variáveis de ambiente obrigatórias não estiverem definidas.
+    """
+
+    if not all([POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB]):
+        raise ValueError("As variáveis de ambiente POSTGRES_USER, POSTGRES_PASSWORD ou POSTGRES_DB não estão definidas.")
+
+    return "%s://%s:%s@%s:%s/%s" % (
+        driver,
+        POSTGRES_USER,
+        POSTGRES_PASSWORD,
+        host or POSTGRES_HOST,
+        port or POSTGRES_PORT,
+        POSTGRES_DB,
+    )
+
+def _engine_options() -> dict:
+    """
+        Configuração do pool de conexões e dos caches de instruções, a mesma para o primário e para a réplica.
+    """
+
+    return {
+        "query_cache_size": DB_QUERY_CACHE_SIZE,
+        "poolclass": MonitoredQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+# O início de cada instrução fica no contexto de execução dela, descartado junto com o contexto mesmo quando a
+# instrução falha, e não na conexão, que volta ao pool e é reutilizada.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    if start is not None:
+        context._query_start = None
+        record_statement(statement, parameters, executemany, time.perf_counter() - start)
+
+def _handle_error(exception_context):
+    # Instruções que falharam (ex.: statement_timeout, violação de restrição) também contam no tempo de banco.
+    # Erros depois do after_cursor_execute (ex.: ao ler o resultado) não são contados de novo.
+    context = exception_context.execution_context
+    start = getattr(context, "_query_start", None)
+    if start is not None:
+        context._query_start = None
+        record_statement(exception_context.statement, exception_context.parameters, context.executemany,
+                         time.perf_counter() - start)
+
+def _instrument(engine: AsyncEngine) -> AsyncEngine:
+    """
+        Registra na engine os eventos que cronometram cada instrução, inclusive as que falham: o tempo e a contagem
+        são somados à requisição atual (GET /metrics e header Server-Timing), e as instruções lentas ou repetidas
+        (N+1) são registradas no log (app.monitoring.queries).
+    """
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+    return engine
+
+def _async_database_url(host: Optional[str] = None, port: Optional[str] = None) -> str:
+    """
+        URL de conexão do asyncpg, com o tamanho do cache de instruções preparadas de cada conexão.
+    """
+
+    return "%s?prepared_statement_cache_size=%s" % (
+        get_database_url("postgresql+asyncpg", host, port), DB_STATEMENT_CACHE_SIZE)
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """
+        Cria a engine assíncrona das requisições no primeiro uso. Nenhuma conexão é aberta aqui,
+        elas são criadas pelo pool conforme as sessões precisam.
+
+        Returns:
+            AsyncEngine: Engine assíncrona (asyncpg) do banco de dados.
+    """
+
+    return _instrument(create_async_engine(_async_database_url(), **_engine_options()))
+
+@lru_cache(maxsize=None)
+def get_read_engine() -> AsyncEngine:
+    """
+        Cria a engine das leituras no primeiro uso. Com POSTGRES_REPLICA_HOST definido ela aponta para a réplica,
+        com as transações em modo somente leitura, caso contrário é a própria engine do primário.
+
+        Returns:
+            AsyncEngine: Engine assíncrona (asyncpg) usada pelas rotas de leitura.
+    """
+
+    if not POSTGRES_REPLICA_HOST:
+        return get_async_engine()
+    return _instrument(create_async_engine(
+        _async_database_url(POSTGRES_REPLICA_HOST, POSTGRES_REPLICA_PORT),
+        connect_args={"server_settings": {"default_transaction_read_only": "on"}},
+        **_engine_options()
+    ))
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """
+        Verifica se o cliente fez uma escrita recente e ainda deve ler do primário.
+
+        Args:
+            request: Requisição com o cookie definido por get_db.
+
+        Returns:
+            bool: Se a janela de leitura no primário ainda está aberta.
+    """
+
     try:
-        execute_sql_file(engine, sql_file_path)
-    except Exception as e:
-        _logger.error(f"Erro ao executar o arquivo SQL: %s" % e)
-        raise
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
 
-    # Inserir dados de demonstração
-    with SessionLocal() as db:
-        seed_data(db)
-        _logger.info("Dados de demonstração inseridos com sucesso!")
-else:
-    _logger.info("Banco de dados já existe!")
+def new_session() -> AsyncSession:
+    """
+        Abre uma nova sessão assíncrona do banco de dados.
 
-def get_db():
+        Returns:
+            AsyncSession: Sessão ligada à engine das requisições.
     """
-    Cria uma sessão do banco de dados.
+
+    return AsyncSessionLocal(bind=get_async_engine())
+
+def new_read_session(request: Optional[Request] = None) -> AsyncSession:
+    """
+        Abre uma nova sessão assíncrona para leituras, na réplica quando ela estiver configurada.
+
+        Args:
+            request: Requisição atual. Se o cliente escreveu recentemente a sessão é aberta no primário.
+
+        Returns:
+            AsyncSession: Sessão ligada à engine de leitura ou ao primário.
+    """
+
+    if request is not None and is_pinned_to_primary(request):
+        return new_session()
+    return AsyncSessionLocal(bind=get_read_engine())
+
+async def get_db(response: Response):
+    """
+    Cria uma sessão assíncrona do banco de dados primário, usada pelas rotas de escrita.
+
+    Com a réplica configurada, a resposta recebe um cookie que mantém as leituras do cliente no primário
+    por DB_READ_YOUR_WRITES_SECONDS segundos.
 
     Yields:
         db: Sessão que foi criada do banco de dados.
     """
 
-    db = SessionLocal()
-    try:
+    if POSTGRES_REPLICA_HOST and DB_READ_YOUR_WRITES_SECONDS > 0:
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE,
+            str(time.time() + DB_READ_YOUR_WRITES_SECONDS),
+            max_age=DB_READ_YOUR_WRITES_SECONDS,
+            httponly=True
+        )
+    async with new_session() as db:
+        yield db
+
+async def get_read_db(request: Request):
+    """
+    Cria uma sessão assíncrona para as rotas de leitura (GET), na réplica quando ela estiver configurada.
+
+    Yields:
+        db: Sessão que foi criada do banco de dados.
+    """
+
+    async with new_read_session(request) as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
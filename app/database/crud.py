@@ -1,20 +1,208 @@
 try:
-    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncSession
     from app.models.department import Department as DepartmentModel
     from app.models.job import Job as JobModel
     from app.models.user import User as UserModel
-    from app.models.employee import Employee as EmployeeModel, StateEnum
+    from app.models.employee import Employee as EmployeeModel, EmployeeArchive as EmployeeArchiveModel, StateEnum
+    from app.models.stats import DepartmentStats as DepartmentStatsModel, JobStats as JobStatsModel
+    from app.models.stats import EmployeeSearchName as EmployeeSearchNameModel
     from app.schemas.department import DepartmentCreate, DepartmentUpdate
     from app.schemas.job import JobCreate, JobUpdate
     from app.schemas.user import UserCreate, UserUpdate
-    from app.schemas.employee import EmployeeCreate, EmployeeUpdate
-    from typing import List
+    from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeFilter, SalaryAdjustment
+    from sqlalchemy import cast, delete, func, insert, literal, literal_column, select, text, true, union_all, update
+    from sqlalchemy import Float, Numeric, Row, Select
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from sqlalchemy.exc import DBAPIError
+    from sqlalchemy.orm import noload, selectinload
+    from typing import AsyncIterator, Collection, List, Optional, Tuple
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
+# Tamanho padrão e máximo das páginas retornadas pelas rotas de listagem
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Quantidade de linhas lidas do cursor do servidor a cada lote na exportação
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "last_name",
+    "register_number",
+    "job_id",
+    "department_id",
+    "salary",
+    "status",
+    "is_leader",
+)
+
+# Quantidade máxima de colaboradores aceita em uma única criação em lote
+MAX_BULK_SIZE = 10000
+
+# Relacionamentos do colaborador que podem ser expandidos nas consultas
+EMPLOYEE_RELATIONS = ("job", "department")
+
+# Tabelas consultadas pela listagem de acordo com o filtro de status. Os arquivados ficam em employee_archive.
+EMPLOYEE_TABLES_BY_STATUS = {
+    "active": (EmployeeModel,),
+    "archived": (EmployeeArchiveModel,),
+    "all": (EmployeeModel, EmployeeArchiveModel),
+}
+
+
+def _employee_load_options(expand: Collection[str], model=EmployeeModel) -> list:
+    """
+        Monta as opções de carregamento dos relacionamentos do colaborador.
+
+        Os relacionamentos solicitados são carregados com selectinload, que busca todos os registros relacionados
+        da página em uma única consulta por relacionamento. Os demais ficam com noload, evitando qualquer
+        carregamento implícito (que não é permitido na sessão assíncrona).
+
+        Args:
+            expand: Nomes dos relacionamentos que devem ser carregados.
+            model: Modelo consultado (EmployeeModel ou EmployeeArchiveModel).
+
+        Returns:
+            list: Opções de carregamento para a consulta.
+    """
+
+    return [
+        selectinload(getattr(model, name)) if name in expand else noload(getattr(model, name))
+        for name in EMPLOYEE_RELATIONS
+    ]
+
+def _apply_employee_filters(stmt: Select, filters: EmployeeFilter, model=EmployeeModel) -> Select:
+    """
+        Aplica na consulta os filtros da listagem de colaboradores.
+
+        Args:
+            stmt: Consulta base dos colaboradores.
+            filters: Filtros informados na requisição. O status é resolvido pela tabela consultada
+                (EMPLOYEE_TABLES_BY_STATUS), então não gera condição na consulta.
+            model: Modelo consultado (EmployeeModel ou EmployeeArchiveModel).
+
+        Returns:
+            Select: Consulta com as condições dos filtros.
+    """
+
+    if filters.department_id is not None:
+        stmt = stmt.where(model.department_id == filters.department_id)
+    if filters.job_id is not None:
+        stmt = stmt.where(model.job_id == filters.job_id)
+    if filters.min_salary is not None:
+        stmt = stmt.where(model.salary >= filters.min_salary)
+    if filters.max_salary is not None:
+        stmt = stmt.where(model.salary <= filters.max_salary)
+    if filters.is_leader is not None:
+        stmt = stmt.where(model.is_leader == filters.is_leader)
+    return stmt
+
+def _employee_full_name():
+    """
+        Monta o nome completo do colaborador (nome e sobrenome), pesquisado na busca de colaboradores.
+
+        A expressão é a mesma do índice ix_employee_full_name e da tabela employee_search_name (init.sql). O separador
+        é escrito como literal no SQL (e não como parâmetro) para que o PostgreSQL reconheça a expressão do índice.
+    """
+
+    return EmployeeModel.name + literal_column("' '") + EmployeeModel.last_name
+
+async def _insert_returning(db: AsyncSession, model, values: dict):
+    """
+        Insere um registro e devolve a linha gravada (incluindo valores preenchidos pelo banco) no próprio INSERT.
+
+        Args:
+            db: Sessão do banco de dados.
+            model: Modelo do registro.
+            values: Valores das colunas.
+
+        Returns:
+            Registro inserido.
+    """
+
+    record = await db.scalar(insert(model).values(**values).returning(model))
+    await db.commit()
+    return record
+
+async def _update_returning(db: AsyncSession, model, record_id: int, values: dict):
+    """
+        Atualiza um registro pela chave primária com UPDATE ... RETURNING, sem buscar o registro antes
+        e sem recarregá-lo depois do commit.
+
+        Args:
+            db: Sessão do banco de dados.
+            model: Modelo do registro.
+            record_id: ID do registro.
+            values: Valores que devem ser alterados.
+
+        Returns:
+            Registro atualizado ou None se o ID não existir.
+    """
+
+    if not values:
+        return await db.scalar(select(model).where(model.id == record_id))
+    record = await db.scalar(
+        update(model).where(model.id == record_id).values(**values).returning(model)
+    )
+    await db.commit()
+    return record
+
+async def _delete_by_id(db: AsyncSession, model, record_id: int) -> bool:
+    """
+        Exclui um registro pela chave primária em um único DELETE.
+
+        Args:
+            db: Sessão do banco de dados.
+            model: Modelo do registro.
+            record_id: ID do registro.
+
+        Returns:
+            bool: Se algum registro foi excluído.
+    """
+
+    result = await db.execute(
+        delete(model).where(model.id == record_id).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+async def _paginate(
+    db: AsyncSession,
+    stmt: Select,
+    model,
+    limit: int,
+    after_id: Optional[int]
+) -> Tuple[list, Optional[int]]:
+    """
+        Aplica a paginação por cursor (keyset) sobre a chave primária do modelo.
+
+        A busca é feita com "id > after_id ORDER BY id LIMIT n", que percorre apenas o trecho necessário do índice
+        da chave primária, independente do tamanho da tabela. É buscado um registro a mais que o limite apenas para
+        saber se existe uma próxima página.
+
+        Args:
+            db: Sessão do banco de dados.
+            stmt: Consulta base do modelo.
+            model: Modelo que está sendo paginado.
+            limit: Quantidade máxima de registros da página.
+            after_id: ID do último registro da página anterior.
+
+        Returns:
+            Tuple[list, Optional[int]]: Registros da página e o cursor da próxima página (None se for a última).
+    """
+
+    if after_id is not None:
+        stmt = stmt.where(model.id > after_id)
+    rows = (await db.scalars(stmt.order_by(model.id).limit(limit + 1))).all()
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1].id
+    return rows, None
+
+
 
 # CRUD dos colaboradores
-def create_employee(db: Session, employee: EmployeeCreate) -> EmployeeModel:
+async def create_employee(db: AsyncSession, employee: EmployeeCreate) -> EmployeeModel:
     """
         Cria um novo colaborador no banco de dados.
 
@@ -26,43 +214,320 @@ def create_employee(db: Session, employee: EmployeeCreate) -> EmployeeModel:
             EmployeeModel: Retorna os dados do colaborador que foi criado.
     """
 
-    db_employee = EmployeeModel(**employee.dict())
-    db.add(db_employee)
-    db.commit()
-    db.refresh(db_employee)
-    return db_employee
+    return await _insert_returning(db, EmployeeModel, employee.dict())
+
+def _database_error_detail(error: DBAPIError) -> str:
+    """
+        Extrai a mensagem com que o banco recusou a instrução (ex.: RAISE EXCEPTION das triggers do init.sql).
+    """
+
+    return getattr(error.orig.__cause__, "message", None) or str(error.orig)
 
-def get_all_employees(db: Session) -> List[EmployeeModel]:
+async def create_employees_bulk(
+    db: AsyncSession,
+    employees: List[EmployeeCreate]
+) -> Tuple[List[EmployeeModel], List[dict]]:
     """
-        Faz uma busca de todos os colaboradores cadastrados no sistema.
+        Cria vários colaboradores de uma vez, validando cada registro sem interromper os registros válidos.
+
+        As validações que antes eram feitas linha a linha (cargo existente, matrícula única e cargo de liderança
+        livre) são resolvidas com uma consulta para todo o lote. Os registros válidos são inseridos com INSERT
+        multi-linhas e RETURNING e confirmados em um único commit. O department_id é preenchido pela trigger
+        set_employee_department no próprio INSERT. Um conflito com uma transação concorrente recusa apenas os
+        registros envolvidos, e não o lote.
+
+        Args:
+            db: Sessão do banco de dados.
+            employees: Lista de colaboradores a serem inseridos.
+
+        Returns:
+            Tuple[List[EmployeeModel], List[dict]]: Colaboradores criados e os erros com o índice do registro recusado.
+    """
+
+    job_ids = {employee.job_id for employee in employees}
+    jobs = {
+        job.id: job
+        for job in await db.execute(
+            select(JobModel.id, JobModel.is_leadership).where(JobModel.id.in_(job_ids))
+        )
+    }
+    register_numbers = {employee.register_number for employee in employees}
+    # A matrícula é única entre os ativos e os arquivados
+    taken_register_numbers = set(await db.scalars(union_all(
+        select(EmployeeModel.register_number).where(EmployeeModel.register_number.in_(register_numbers)),
+        select(EmployeeArchiveModel.register_number).where(EmployeeArchiveModel.register_number.in_(register_numbers)),
+    )))
+    leadership_job_ids = [job.id for job in jobs.values() if job.is_leadership]
+    taken_leadership_jobs = set(await db.scalars(
+        select(EmployeeModel.job_id).where(EmployeeModel.job_id.in_(leadership_job_ids)).distinct()
+    )) if leadership_job_ids else set()
+
+    rows, errors = [], []
+    for index, employee in enumerate(employees):
+        job = jobs.get(employee.job_id)
+        if not job:
+            errors.append({"index": index, "detail": "Cargo inválido."})
+            continue
+        if employee.status not in StateEnum.__members__:
+            errors.append({"index": index, "detail": "Status inválido."})
+            continue
+        if employee.register_number in taken_register_numbers:
+            errors.append({"index": index, "detail": "Matrícula %s já cadastrada." % employee.register_number})
+            continue
+        if job.is_leadership and job.id in taken_leadership_jobs:
+            errors.append({"index": index, "detail": "O cargo de liderança já está ocupado."})
+            continue
+
+        # Reserva a matrícula e o cargo de liderança para os próximos registros do próprio lote
+        taken_register_numbers.add(employee.register_number)
+        if job.is_leadership:
+            taken_leadership_jobs.add(job.id)
+
+        rows.append((index, employee.dict()))
+
+    created = []
+    if rows:
+        # Uma matrícula gravada por outra transação depois da consulta acima é ignorada pelo ON CONFLICT, e o
+        # registro fica de fora do RETURNING
+        stmt = (
+            pg_insert(EmployeeModel)
+            .on_conflict_do_nothing(index_elements=[EmployeeModel.register_number])
+            .returning(EmployeeModel)
+        )
+        try:
+            async with db.begin_nested():
+                inserted = (await db.scalars(stmt, [row for _, row in rows])).all()
+        except DBAPIError:
+            # As demais regras (cargo de liderança ocupado por outra transação, matrícula de um arquivado) derrubam a
+            # instrução inteira. Os registros são gravados um a um, e apenas os que falharem são recusados.
+            inserted = []
+            for index, row in rows:
+                try:
+                    async with db.begin_nested():
+                        employee = await db.scalar(stmt.values(**row))
+                except DBAPIError as error:
+                    errors.append({"index": index, "detail": _database_error_detail(error)})
+                    continue
+                if employee is not None:
+                    inserted.append(employee)
+
+        inserted_by_register_number = {employee.register_number: employee for employee in inserted}
+        rejected = {error["index"] for error in errors}
+        for index, row in rows:
+            employee = inserted_by_register_number.get(row["register_number"])
+            if employee is not None:
+                created.append(employee)
+            elif index not in rejected:
+                errors.append({"index": index, "detail": "Matrícula %s já cadastrada." % row["register_number"]})
+        errors.sort(key=lambda error: error["index"])
+        await db.commit()
+    return created, errors
+
+async def get_all_employees(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after_id: Optional[int] = None,
+    expand: Collection[str] = (),
+    filters: Optional[EmployeeFilter] = None
+) -> Tuple[List[EmployeeModel], Optional[int]]:
+    """
+        Faz uma busca paginada dos colaboradores cadastrados no sistema.
+
+        Args:
+            db: Sessão do banco de dados.
+            limit: Quantidade máxima de colaboradores na página.
+            after_id: ID do último colaborador da página anterior.
+            expand: Relacionamentos (job, department) que devem ser carregados junto com a página.
+            filters: Filtros de departamento, cargo, status, faixa salarial e liderança. Por padrão
+                apenas os colaboradores ativos são listados.
+
+        Returns:
+            Tuple[List[EmployeeModel], Optional[int]]: Colaboradores da página e o cursor da próxima página.
+    """
+
+    filters = filters or EmployeeFilter()
+    pages = [
+        await _paginate(
+            db,
+            _apply_employee_filters(select(model), filters, model).options(*_employee_load_options(expand, model)),
+            model,
+            limit,
+            after_id
+        )
+        for model in EMPLOYEE_TABLES_BY_STATUS[filters.status]
+    ]
+    if len(pages) == 1:
+        return pages[0]
+
+    # Com status "all" cada tabela devolve a sua página e as duas são intercaladas pelo ID, que é único
+    # entre as tabelas porque o arquivamento mantém o ID original.
+    rows = sorted((row for page, _ in pages for row in page), key=lambda row: row.id)
+    if len(rows) > limit or any(cursor is not None for _, cursor in pages):
+        return rows[:limit], rows[limit - 1].id
+    return rows, None
+
+async def search_employees(
+    db: AsyncSession,
+    query: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0
+) -> Tuple[List[Row], Optional[int]]:
+    """
+        Faz uma busca aproximada de colaboradores pelo nome e sobrenome, ou pelo início da matrícula.
+
+        A similaridade de palavras (pg_trgm) é calculada sobre os nomes completos distintos (employee_search_name),
+        bem menos numerosos que os colaboradores. Os resultados vêm ordenados pela similaridade, pelo nome e pelo ID,
+        então a quantidade de colaboradores de cada nome indica quais nomes alcançam a página, e apenas os
+        colaboradores desses nomes são lidos, em ordem pelo índice ix_employee_full_name. As matrículas que começam
+        com o termo vêm antes dos nomes, com pontuação 1 e em ordem de matrícula. A página é montada sobre os IDs, e
+        apenas os colaboradores dela são lidos da tabela.
 
         Args:
             db: Sessão do banco de dados.
+            query: Termo pesquisado.
+            limit: Quantidade máxima de colaboradores na página.
+            offset: Quantidade de resultados a pular, que é o next_offset da página anterior.
 
         Returns:
-            List[EmployeeModel]: Retorna a lista de todos os colaboradores.
+            Tuple[List[Row], Optional[int]]: Colaboradores com a pontuação (score) e o offset da próxima página.
+    """
+
+    needed = offset + limit + 1
+    term = literal(query)
+
+    # Os desempates usam a collation "C", a mesma do ix_employee_register_number_prefix, para que a ordem não dependa
+    # da collation do banco
+    names = (
+        select(
+            EmployeeSearchNameModel.full_name,
+            EmployeeSearchNameModel.headcount,
+            func.word_similarity(term, EmployeeSearchNameModel.full_name).label("score"),
+        )
+        .where(term.bool_op("<%")(EmployeeSearchNameModel.full_name))
+        .subquery()
+    )
+    name_order = (names.c.score.desc(), names.c.full_name.collate("C"))
+    # Colaboradores dos nomes que vêm antes de cada nome na ordenação
+    ahead = func.sum(names.c.headcount).over(order_by=name_order) - names.c.headcount
+    ranked_names = select(names.c.full_name, names.c.score, ahead.label("ahead")).subquery()
+    page_names = (
+        select(ranked_names.c.full_name, ranked_names.c.score)
+        .where(ranked_names.c.ahead < needed)
+        .subquery()
+    )
+    name_ids = (
+        select(EmployeeModel.id)
+        .where(_employee_full_name() == page_names.c.full_name)
+        .order_by(EmployeeModel.id)
+        .limit(needed)
+        .lateral()
+    )
+    by_name = (
+        select(
+            name_ids.c.id,
+            literal(1).label("rank"),
+            page_names.c.score,
+            page_names.c.full_name.collate("C").label("sort_key"),
+        )
+        .select_from(page_names)
+        .join(name_ids, true())
+    )
+
+    register_number = EmployeeModel.register_number.collate("C")
+    by_register_number = (
+        select(
+            EmployeeModel.id,
+            literal(0).label("rank"),
+            literal(1.0, Float).label("score"),
+            register_number.label("sort_key"),
+        )
+        .where(register_number.startswith(query, autoescape=True))
+        .order_by(register_number)
+        .limit(needed)
+    )
+
+    # Cada origem entrega pelo menos os primeiros offset + limit + 1 na própria ordem, o suficiente para a página.
+    # Um colaborador encontrado pelas duas fica na posição da matrícula.
+    candidates = union_all(by_register_number, by_name).subquery()
+    unique = (
+        select(candidates)
+        .distinct(candidates.c.id)
+        .order_by(candidates.c.id, candidates.c.rank)
+        .subquery()
+    )
+    page = (
+        select(unique)
+        .order_by(unique.c.rank, unique.c.score.desc(), unique.c.sort_key, unique.c.id)
+        .offset(offset)
+        .limit(limit + 1)
+        .subquery()
+    )
+    stmt = (
+        select(*EmployeeModel.__table__.c, page.c.score)
+        .join(page, page.c.id == EmployeeModel.id)
+        .order_by(page.c.rank, page.c.score.desc(), page.c.sort_key, EmployeeModel.id)
+    )
+    # O plano genérico que o PostgreSQL adota para a instrução preparada depois de algumas execuções não usa o índice
+    # no LIKE da matrícula nem descarta nomes pelo termo, então cada busca é planejada com os próprios valores
+    await db.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+    rows = (await db.execute(stmt)).all()
+    if len(rows) > limit:
+        return rows[:limit], offset + limit
+    return rows, None
+
+async def stream_employees(db: AsyncSession, chunk_size: int = EXPORT_CHUNK_SIZE) -> AsyncIterator[List[dict]]:
+    """
+        Lê todos os colaboradores através de um cursor no servidor, devolvendo lotes de registros.
+        Os ativos são lidos primeiro e em seguida os arquivados (employee_archive), cada tabela em ordem de ID.
+
+        As linhas são buscadas como tuplas simples (sem instanciar o modelo), então nada fica acumulado no
+        identity map da sessão e o consumo de memória depende apenas do tamanho do lote.
+
+        Args:
+            db: Sessão do banco de dados.
+            chunk_size: Quantidade de registros por lote.
+
+        Returns:
+            AsyncIterator[List[dict]]: Lotes de colaboradores, com os campos de EXPORT_FIELDS.
     """
 
-    return db.query(EmployeeModel).all()
+    for model in (EmployeeModel, EmployeeArchiveModel):
+        columns = [model.__table__.c[field] for field in EXPORT_FIELDS]
+        result = await db.stream(
+            select(*columns).order_by(model.id).execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions():
+            rows = []
+            for row in partition:
+                data = row._asdict()
+                data["status"] = data["status"].value if data["status"] else None
+                rows.append(data)
+            yield rows
 
-def get_employee_by_id(db: Session, employee_id: int) -> EmployeeModel:
+async def get_employee_by_id(db: AsyncSession, employee_id: int, expand: Collection[str] = ()) -> EmployeeModel:
     """
-        Faz uma busca de um colaborador pelo ID.
+        Faz uma busca de um colaborador pelo ID. Se ele não estiver entre os ativos, a busca é feita
+        no histórico de arquivados.
+
+        A busca usa db.get, que consulta primeiro o identity map da sessão e reaproveita a instrução já
+        compilada pelo SQLAlchemy, em vez de montar e compilar um novo SELECT a cada chamada.
 
         Args:
             db: Sessão do banco de dados.
             employee_id: ID do colaborador.
+            expand: Relacionamentos (job, department) que devem ser carregados junto com o colaborador.
 
         Returns:
             EmployeeModel: Retorna o colaborador correspondente ao ID.
     """
 
-    employee = db.query(EmployeeModel).filter(EmployeeModel.id == employee_id).first()
-    if not employee:
-        return None
-    return employee
+    for model in (EmployeeModel, EmployeeArchiveModel):
+        employee = await db.get(model, employee_id, options=_employee_load_options(expand, model))
+        if employee:
+            return employee
+    return None
 
-def promote_employee(db: Session, employee_id: int, update_data: EmployeeUpdate) -> EmployeeModel:
+async def promote_employee(db: AsyncSession, employee_id: int, update_data: EmployeeUpdate) -> EmployeeModel:
     """
         Promove e/ou atualiza as informações de um colaborador já cadastrado.
 
@@ -72,61 +537,128 @@ def promote_employee(db: Session, employee_id: int, update_data: EmployeeUpdate)
             update_data: Dados de atualização do colaborador.
 
         Returns:
-            EmployeeModel: Retorna o colaborador atualizado.
+            EmployeeModel: Retorna o colaborador atualizado ou None se o ID não existir.
     """
 
-    employee = get_employee_by_id(db, employee_id)
-
+    values = {}
     if update_data.name:
-        employee.name = update_data.name
+        values["name"] = update_data.name
     if update_data.last_name:
-        employee.last_name = update_data.last_name
+        values["last_name"] = update_data.last_name
     if update_data.job_id:
-        employee.job_id = update_data.job_id
+        values["job_id"] = update_data.job_id
     if update_data.salary:
-        employee.salary = update_data.salary
+        values["salary"] = update_data.salary
 
-    db.commit()
-    db.refresh(employee)
-    return employee
+    return await _update_returning(db, EmployeeModel, employee_id, values)
 
-def terminate_employee(db: Session, employee_id: int) -> EmployeeModel:
+async def terminate_employee(db: AsyncSession, employee_id: int) -> EmployeeModel:
     """
-        Arquiva um colaborador, alterando seu status para 'arquivado'. Cadastros arquivados não são mais retornados na API
-        que verifica todos os colaboradores cadastrados no sistema.
+        Arquiva um colaborador, alterando seu status para 'arquivado'. A trigger archive_employees move o cadastro
+        para a tabela employee_archive, e ele deixa de ser retornado na listagem padrão dos colaboradores.
 
         Args:
             db: Sessão do banco de dados.
             employee_id: ID do colaborador.
 
         Returns:
-            EmployeeModel: O colaborador com o status atualizado.
+            EmployeeModel: O colaborador com o status atualizado ou None se o ID não existir.
     """
-    employee = get_employee_by_id(db, employee_id)
+    return await _update_returning(db, EmployeeModel, employee_id, {"status": StateEnum.archived})
 
-    employee.status = StateEnum.archived
-    db.commit()
-    db.refresh(employee)
-    return employee
+def _adjusted_salary(salary, adjustment: SalaryAdjustment):
+    """
+        Monta a expressão do novo salário, arredondado para centavos.
 
-def delete_employee(db: Session, employee_id: int) -> None:
+        Args:
+            salary: Coluna com o salário atual.
+            adjustment: Tipo ("percentage" ou "fixed") e valor do reajuste.
     """
-        Exclui um colaborador do banco de dados.
+
+    if adjustment.mode == "percentage":
+        adjusted = salary * (1 + adjustment.value / 100)
+    else:
+        adjusted = salary + adjustment.value
+    return func.round(cast(adjusted, Numeric), 2)
+
+async def adjust_salaries(db: AsyncSession, adjustment: SalaryAdjustment) -> Optional[dict]:
+    """
+        Aplica um reajuste salarial a todos os colaboradores ativos que atendem aos filtros.
+
+        O reajuste é feito com um único UPDATE ... FROM sobre os colaboradores selecionados (travados com
+        FOR UPDATE), e o RETURNING do UPDATE é agregado na mesma consulta para obter o impacto na folha.
+        No modo de simulação (dry_run) é executado apenas o SELECT agregado, sem alterar nenhum registro.
 
         Args:
             db: Sessão do banco de dados.
-            employee_id: ID do colaborador a ser excluído.
+            adjustment: Tipo e valor do reajuste, filtros e se é apenas uma simulação.
 
         Returns:
-            None: Sem retornos.
+            Optional[dict]: Quantidade de colaboradores afetados e o total da folha antes e depois do reajuste, ou
+            None se o reajuste deixaria algum salário menor ou igual a zero (nesse caso nada é alterado).
+    """
+
+    filters = EmployeeFilter(**adjustment.filters.dict())
+    table = EmployeeModel.__table__
+    if adjustment.dry_run:
+        affected = _apply_employee_filters(
+            select(EmployeeModel.salary.label("old_salary"),
+                   _adjusted_salary(EmployeeModel.salary, adjustment).label("new_salary")),
+            filters
+        ).subquery("affected")
+    else:
+        selected = _apply_employee_filters(select(EmployeeModel.id, EmployeeModel.salary), filters) \
+            .with_for_update().subquery("selected")
+        affected = (
+            update(table)
+            .where(table.c.id == selected.c.id)
+            .values(salary=_adjusted_salary(selected.c.salary, adjustment))
+            .returning(selected.c.salary.label("old_salary"), table.c.salary.label("new_salary"))
+            .cte("affected")
+        )
+
+    result = (await db.execute(select(
+        func.count().label("affected"),
+        func.coalesce(func.sum(affected.c.old_salary), 0).label("payroll_before"),
+        func.coalesce(func.sum(affected.c.new_salary), 0).label("payroll_after"),
+        func.min(affected.c.new_salary).label("lowest_salary"),
+    ))).one()
+    if result.lowest_salary is not None and result.lowest_salary <= 0:
+        # Nenhum salário pode ficar zerado ou negativo: o UPDATE (se houve) é desfeito e o reajuste é recusado
+        await db.rollback()
+        return None
+    if not adjustment.dry_run:
+        await db.commit()
+
+    # A folha anterior é a soma da coluna Float e a nova, no modo de simulação, a soma do valor Numeric arredondado
+    payroll_before = float(result.payroll_before)
+    payroll_after = float(result.payroll_after)
+    return {
+        "dry_run": adjustment.dry_run,
+        "affected": result.affected,
+        "payroll_before": round(payroll_before, 2),
+        "payroll_after": round(payroll_after, 2),
+        "payroll_increase": round(payroll_after - payroll_before, 2),
+    }
+
+async def delete_employee(db: AsyncSession, employee_id: int) -> bool:
     """
-    employee = get_employee_by_id(db, employee_id)
+        Exclui um colaborador do banco de dados, esteja ele ativo ou arquivado.
+
+        Args:
+            db: Sessão do banco de dados.
+            employee_id: ID do colaborador a ser excluído.
 
-    db.delete(employee)
-    db.commit()
+        Returns:
+            bool: Se o registro existia e foi excluído.
+    """
+    return (
+        await _delete_by_id(db, EmployeeModel, employee_id)
+        or await _delete_by_id(db, EmployeeArchiveModel, employee_id)
+    )
 
 # CRUD dos departamentos
-def create_department(db: Session, department: DepartmentCreate) -> DepartmentModel:
+async def create_department(db: AsyncSession, department: DepartmentCreate) -> DepartmentModel:
     """
         Cria um novo departamento no banco de dados.
 
@@ -137,25 +669,27 @@ def create_department(db: Session, department: DepartmentCreate) -> DepartmentMo
         Returns:
             DepartmentModel: Retorna os dados do departamento recém criado
     """
-    db_department = DepartmentModel(**department.dict())
-    db.add(db_department)
-    db.commit()
-    db.refresh(db_department)
-    return db_department
+    return await _insert_returning(db, DepartmentModel, department.dict())
 
-def get_all_departments(db: Session) -> List[DepartmentModel]:
+async def get_all_departments(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after_id: Optional[int] = None
+) -> Tuple[List[DepartmentModel], Optional[int]]:
     """
-        Faz uma busca de todos os departamentos cadastrados.
+        Faz uma busca paginada dos departamentos cadastrados.
 
         Args:
             db: Sessão do banco de dados.
+            limit: Quantidade máxima de departamentos na página.
+            after_id: ID do último departamento da página anterior.
 
         Returns:
-            List[DepartmentModel]: Lista de todos os departamentos cadastrados.
+            Tuple[List[DepartmentModel], Optional[int]]: Departamentos da página e o cursor da próxima página.
     """
-    return db.query(DepartmentModel).all()
+    return await _paginate(db, select(DepartmentModel), DepartmentModel, limit, after_id)
 
-def get_department_by_id(db: Session, department_id: int) -> DepartmentModel:
+async def get_department_by_id(db: AsyncSession, department_id: int) -> DepartmentModel:
     """
         Faz uma busca de departamentos pelo ID.
 
@@ -165,12 +699,53 @@ def get_department_by_id(db: Session, department_id: int) -> DepartmentModel:
         Returns:
             DepartmentModel: Retorna o departamento cadastrado
     """
-    department = db.query(DepartmentModel).filter(DepartmentModel.id == department_id).first()
-    if not department:
+    return await db.get(DepartmentModel, department_id)
+
+async def get_department_stats(db: AsyncSession, department_id: int) -> Optional[DepartmentStatsModel]:
+    """
+        Busca os totais de colaboradores ativos, líderes e folha salarial de um departamento.
+
+        Os totais são mantidos pelas triggers do init.sql, então a busca é apenas uma leitura pela chave primária.
+
+        Args:
+            db: Sessão do banco de dados.
+            department_id: ID do departamento.
+
+        Returns:
+            DepartmentStatsModel: Totais do departamento, zerados se ele ainda não tem colaboradores.
+    """
+
+    stats = await db.get(DepartmentStatsModel, department_id)
+    if stats:
+        return stats
+    if not await get_department_by_id(db, department_id):
+        return None
+    return DepartmentStatsModel(department_id=department_id, active_headcount=0, leader_count=0, salary_sum=0.0)
+
+async def archive_department_employees(db: AsyncSession, department_id: int) -> Optional[int]:
+    """
+        Arquiva todos os colaboradores ativos de um departamento com um único UPDATE.
+
+        Args:
+            db: Sessão do banco de dados.
+            department_id: ID do departamento.
+
+        Returns:
+            Optional[int]: Quantidade de colaboradores arquivados ou None se o departamento não existir.
+    """
+
+    result = await db.execute(
+        update(EmployeeModel)
+        .where(EmployeeModel.department_id == department_id)
+        .values(status=StateEnum.archived)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if not result.rowcount and not await db.get(DepartmentModel, department_id):
         return None
-    return department
+    return result.rowcount
 
-def update_department(db: Session, department_id: int, update_data: DepartmentUpdate) -> DepartmentModel:
+async def update_department(db: AsyncSession, department_id: int, update_data: DepartmentUpdate) -> DepartmentModel:
     """
         Atualiza as informações de um departamento buscado pelo ID.
 
@@ -182,14 +757,9 @@ def update_department(db: Session, department_id: int, update_data: DepartmentUp
         Returns:
             DepartmentModel: Retorna o departamento com os dados atualizados.
     """
-    department = get_department_by_id(db, department_id)
-    for field, value in update_data.dict(exclude_unset=True).items():
-        setattr(department, field, value)
-    db.commit()
-    db.refresh(department)
-    return department
+    return await _update_returning(db, DepartmentModel, department_id, update_data.dict(exclude_unset=True))
 
-def delete_department(db: Session, department_id: int) -> None:
+async def delete_department(db: AsyncSession, department_id: int) -> bool:
     """
         Exclui o cadastro de um departamento do banco de dados.
 
@@ -198,14 +768,12 @@ def delete_department(db: Session, department_id: int) -> None:
             department_id: ID do departamento que deverá ser excluído.
 
         Returns:
-            None: Sem retorno.
+            bool: Se o registro existia e foi excluído.
     """
-    department = get_department_by_id(db, department_id)
-    db.delete(department)
-    db.commit()
+    return await _delete_by_id(db, DepartmentModel, department_id)
 
 # CRUD dos cargos
-def create_job(db: Session, job: JobCreate) -> JobModel:
+async def create_job(db: AsyncSession, job: JobCreate) -> JobModel:
     """
         Cria um novo cadastro de cargo no banco de dados.
 
@@ -216,25 +784,27 @@ def create_job(db: Session, job: JobCreate) -> JobModel:
         Returns:
             JobModel: Retorna o cargo cargo criado.
     """
-    db_job = JobModel(**job.dict())
-    db.add(db_job)
-    db.commit()
-    db.refresh(db_job)
-    return db_job
+    return await _insert_returning(db, JobModel, job.dict())
 
-def get_all_jobs(db: Session) -> List[JobModel]:
+async def get_all_jobs(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after_id: Optional[int] = None
+) -> Tuple[List[JobModel], Optional[int]]:
     """
-        Faz uma busca de todos os cargos cadastrados.
+        Faz uma busca paginada dos cargos cadastrados.
 
         Args:
             db: Sessão do banco de dados.
+            limit: Quantidade máxima de cargos na página.
+            after_id: ID do último cargo da página anterior.
 
         Returns:
-            List[JobModel]: Retorna a lista de todos os cargos.
+            Tuple[List[JobModel], Optional[int]]: Cargos da página e o cursor da próxima página.
     """
-    return db.query(JobModel).all()
+    return await _paginate(db, select(JobModel), JobModel, limit, after_id)
 
-def get_job_by_id(db: Session, job_id: int) -> JobModel:
+async def get_job_by_id(db: AsyncSession, job_id: int) -> JobModel:
     """
         Busca um cargo na tabela pelo ID.
 
@@ -245,12 +815,30 @@ def get_job_by_id(db: Session, job_id: int) -> JobModel:
         Returns:
             JobModel: Retorna o cargo que responde ao ID.
     """
-    job = db.query(JobModel).filter(JobModel.id == job_id).first()
-    if not job:
+    return await db.get(JobModel, job_id)
+
+async def get_job_stats(db: AsyncSession, job_id: int) -> Optional[JobStatsModel]:
+    """
+        Busca os totais de colaboradores ativos, líderes e folha salarial de um cargo.
+
+        Os totais são mantidos pelas triggers do init.sql, então a busca é apenas uma leitura pela chave primária.
+
+        Args:
+            db: Sessão do banco de dados.
+            job_id: ID do cargo.
+
+        Returns:
+            JobStatsModel: Totais do cargo, zerados se ele ainda não tem colaboradores.
+    """
+
+    stats = await db.get(JobStatsModel, job_id)
+    if stats:
+        return stats
+    if not await get_job_by_id(db, job_id):
         return None
-    return job
+    return JobStatsModel(job_id=job_id, active_headcount=0, leader_count=0, salary_sum=0.0)
 
-def update_job(db: Session, job_id: int, update_data: JobUpdate) -> JobModel:
+async def update_job(db: AsyncSession, job_id: int, update_data: JobUpdate) -> JobModel:
     """
         Faz uma busca de um cargo na tabela pelo ID para ser atualizado.
 
@@ -262,14 +850,9 @@ def update_job(db: Session, job_id: int, update_data: JobUpdate) -> JobModel:
         Returns:
             JobModel: Retorna o cargo com dados atualizados que respondem ao ID.
     """
-    job = get_job_by_id(db, job_id)
-    for field, value in update_data.dict(exclude_unset=True).items():
-        setattr(job, field, value)
-    db.commit()
-    db.refresh(job)
-    return job
+    return await _update_returning(db, JobModel, job_id, update_data.dict(exclude_unset=True))
 
-def delete_job(db: Session, job_id: int) -> None:
+async def delete_job(db: AsyncSession, job_id: int) -> bool:
     """
         Busca um cargo na tabela pelo ID para ser deletado.
 
@@ -278,14 +861,12 @@ def delete_job(db: Session, job_id: int) -> None:
             job_id: ID do cargo.
 
         Returns:
-            None: Sem retorno.
+            bool: Se o registro existia e foi excluído.
     """
-    job = get_job_by_id(db, job_id)
-    db.delete(job)
-    db.commit()
+    return await _delete_by_id(db, JobModel, job_id)
 
 # CRUD dos usuários
-def create_user(db: Session, user: UserCreate) -> UserModel:
+async def create_user(db: AsyncSession, user: UserCreate) -> UserModel:
     """
         Cria um novo cadastro de usuário no banco de dados.
 
@@ -296,25 +877,27 @@ def create_user(db: Session, user: UserCreate) -> UserModel:
         Returns:
             UserModel: Retorna os dados do usuário recém-criado.
     """
-    db_user = UserModel(**user.dict())
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    return await _insert_returning(db, UserModel, user.dict())
 
-def get_all_users(db: Session) -> List[UserModel]:
+async def get_all_users(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after_id: Optional[int] = None
+) -> Tuple[List[UserModel], Optional[int]]:
     """
-        Busca todos os usuários cadastrados na tabela.
+        Busca de forma paginada os usuários cadastrados na tabela.
 
         Args:
             db: Sessão do banco de dados.
+            limit: Quantidade máxima de usuários na página.
+            after_id: ID do último usuário da página anterior.
 
         Returns:
-            List[UserModel]: Retorna a lista de todos os usuários.
+            Tuple[List[UserModel], Optional[int]]: Usuários da página e o cursor da próxima página.
     """
-    return db.query(UserModel).all()
+    return await _paginate(db, select(UserModel), UserModel, limit, after_id)
 
-def get_user_by_id(db: Session, user_id: int) -> UserModel:
+async def get_user_by_id(db: AsyncSession, user_id: int) -> UserModel:
     """
         Consulta um usuário pelo ID.
 
@@ -325,12 +908,9 @@ def get_user_by_id(db: Session, user_id: int) -> UserModel:
         Returns:
             UserModel: Retorna o usuário correspondente ao ID.
     """
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if not user:
-        return None
-    return user
+    return await db.get(UserModel, user_id)
 
-def update_user(db: Session, user_id: int, update_data: UserUpdate) -> UserModel:
+async def update_user(db: AsyncSession, user_id: int, update_data: UserUpdate) -> UserModel:
     """
         Atualiza todas as informações de um usuário buscando o cadastro pelo ID.
 
@@ -343,14 +923,9 @@ def update_user(db: Session, user_id: int, update_data: UserUpdate) -> UserModel
             UserModel: Retorna os dados do usuário atualizado.
     """
 
-    user = get_user_by_id(db, user_id)
-    for field, value in update_data.dict(exclude_unset=True).items():
-        setattr(user, field, value)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await _update_returning(db, UserModel, user_id, update_data.dict(exclude_unset=True))
 
-def update_user_password(db: Session, user_id: int, update_data: UserUpdate) -> UserModel:
+async def update_user_password(db: AsyncSession, user_id: int, update_data: UserUpdate) -> UserModel:
     """
         Atualiza somente a senha de um usuário com as novas informações vindas da API.
 
@@ -363,13 +938,9 @@ def update_user_password(db: Session, user_id: int, update_data: UserUpdate) ->
             UserModel: Retorna os dados do usuário atualizado.
     """
 
-    user = get_user_by_id(db, user_id)
-    user.passw = update_data.passw
-    db.commit()
-    db.refresh(user)
-    return user
+    return await _update_returning(db, UserModel, user_id, {"passw": update_data.passw})
 
-def delete_user(db: Session, user_id: int) -> None:
+async def delete_user(db: AsyncSession, user_id: int) -> bool:
     """
         Exclui um usuário do banco de dados.
 
@@ -378,8 +949,6 @@ def delete_user(db: Session, user_id: int) -> None:
             user_id: ID do usuário que deve ser excluído.
 
         Returns:
-            None: Sem retornos.
+            bool: Se o registro existia e foi excluído.
     """
-    user = get_user_by_id(db, user_id)
-    db.delete(user)
-    db.commit()
+    return await _delete_by_id(db, UserModel, user_id)
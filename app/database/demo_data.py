@@ -12,6 +12,27 @@ except Exception as error:
 fake = Faker()
 
 
+def fake_employee_payload(job_id: int, register_prefix: str = "") -> dict:
+    """
+        Gera os dados de um novo colaborador no formato aceito por POST /employees, como nos testes da API.
+
+        Args:
+            job_id: ID do cargo do colaborador.
+            register_prefix: Prefixo da matrícula, que separa os colaboradores gerados das matrículas numéricas
+                             do gerador de dados (app.database.generator) e de outras execuções.
+
+        Returns:
+            dict: Dados do colaborador com matrícula única nesta execução.
+    """
+
+    return {
+        "name": fake.first_name(),
+        "last_name": fake.last_name(),
+        "register_number": register_prefix + fake.unique.bothify(text="#########"),
+        "job_id": job_id,
+        "salary": fake.pyfloat(left_digits=5, right_digits=2, positive=True, min_value=1500, max_value=10000),
+    }
+
 # Inserindo dados de demonstração
 def seed_data(db: Session):
 
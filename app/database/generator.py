@@ -0,0 +1,297 @@
+try:
+    import io
+    import csv
+    import time
+    import random
+    import logging
+    import argparse
+    from typing import Iterable, Iterator, List, Sequence
+    from faker import Faker
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import Engine
+    from app.database.conn import get_database_url
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# Tabelas carregadas, na ordem das chaves estrangeiras, e tabelas cujos índices secundários são recriados no final
+TABLES = (
+    "department", "job", "employee", "employee_archive", "user", "department_stats", "job_stats", "employee_search_name",
+)
+INDEXED_TABLES = ("employee", "employee_archive", "user", "employee_search_name")
+
+# Quantidade de nomes e sobrenomes gerados pelo Faker, sorteados depois para cada colaborador
+NAME_POOL_SIZE = 2000
+
+REBUILD_STATS = (
+    """
+    INSERT INTO department_stats (department_id, active_headcount, leader_count, salary_sum)
+    SELECT department_id, COUNT(*), COUNT(*) FILTER (WHERE is_leader), SUM(salary)
+    FROM employee
+    WHERE status = 'active' AND department_id IS NOT NULL
+    GROUP BY department_id
+    """,
+    """
+    INSERT INTO job_stats (job_id, active_headcount, leader_count, salary_sum)
+    SELECT job_id, COUNT(*), COUNT(*) FILTER (WHERE is_leader), SUM(salary)
+    FROM employee
+    WHERE status = 'active'
+    GROUP BY job_id
+    """,
+    """
+    INSERT INTO employee_search_name (full_name, headcount)
+    SELECT name || ' ' || last_name, COUNT(*)
+    FROM employee
+    WHERE status = 'active'
+    GROUP BY name || ' ' || last_name
+    """,
+)
+
+
+def _job_code(job_id: int) -> str:
+    """
+        Código único de 4 caracteres do cargo (base 36 do ID).
+    """
+
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    code = ""
+    while job_id:
+        job_id, remainder = divmod(job_id, 36)
+        code = digits[remainder] + code
+    return code.rjust(4, "0")
+
+def _copy(cursor, table: str, columns: Sequence[str], rows: Iterable[tuple], chunk_size: int) -> int:
+    """
+        Carrega as linhas na tabela com COPY FROM STDIN, enviando um bloco de CSV a cada chunk_size linhas.
+
+        Returns:
+            int: Quantidade de linhas carregadas.
+    """
+
+    statement = 'COPY "%s" (%s) FROM STDIN WITH (FORMAT csv)' % (table, ", ".join(columns))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    total = pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == chunk_size:
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+            buffer.seek(0)
+            buffer.truncate()
+            total += pending
+            pending = 0
+    if pending:
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+        total += pending
+    return total
+
+def _drop_secondary_indexes(cursor, tables: Sequence[str]) -> List[str]:
+    """
+        Remove os índices que não pertencem a constraints (chave primária e unique), que são recriados após a carga.
+        Criar o índice uma vez sobre a tabela cheia é bem mais rápido que atualizá-lo linha a linha no COPY.
+
+        Returns:
+            List[str]: Definições (CREATE INDEX) dos índices removidos.
+    """
+
+    cursor.execute(
+        """
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = current_schema()
+          AND i.tablename = ANY(%s)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conname = i.indexname)
+        """,
+        (list(tables),)
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute('DROP INDEX "%s"' % name)
+    return [definition for _, definition in indexes]
+
+def generate(
+    engine: Engine,
+    departments: int,
+    jobs_per_department: int,
+    employees: int,
+    users: int,
+    archived_ratio: float = 0.1,
+    seed: int = 42,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict:
+    """
+        Gera um conjunto de dados sintético e o carrega com COPY em uma única transação.
+
+        As regras que as triggers do init.sql aplicariam linha a linha são resolvidas na geração: o departamento de
+        cada colaborador é o do seu cargo, o primeiro cargo de cada departamento é de liderança e é ocupado por um único
+        colaborador, que é o líder do departamento, e os arquivados vão direto para employee_archive. Por isso as
+        triggers das tabelas são desativadas durante a carga, e os totais de department_stats, job_stats e
+        employee_search_name são recalculados no final. Com a mesma semente, o conjunto gerado é sempre o mesmo.
+
+        Args:
+            engine: Engine síncrona (psycopg2) do banco de destino, com as tabelas vazias.
+            departments: Quantidade de departamentos.
+            jobs_per_department: Cargos por departamento (o primeiro é de liderança).
+            employees: Quantidade de colaboradores, incluindo os arquivados.
+            users: Quantidade de usuários, associados a colaboradores ativos distintos.
+            archived_ratio: Fração dos colaboradores (exceto líderes) que é gerada como arquivada.
+            seed: Semente dos dados gerados.
+            chunk_size: Linhas enviadas em cada bloco do COPY.
+
+        Returns:
+            dict: Quantidade de registros carregados em cada tabela.
+    """
+
+    if jobs_per_department < 2:
+        raise ValueError("São necessários ao menos 2 cargos por departamento (um de liderança).")
+    if employees < departments:
+        raise ValueError("São necessários ao menos um colaborador por departamento, para ocupar a liderança.")
+
+    rng = random.Random(seed)
+    fake = Faker("pt_BR")
+    fake.seed_instance(seed)
+    first_names = [fake.first_name() for _ in range(NAME_POOL_SIZE)]
+    last_names = [fake.last_name() for _ in range(NAME_POOL_SIZE)]
+
+    def job_id(department: int, position: int) -> int:
+        return (department - 1) * jobs_per_department + position
+
+    def employee_rows(archived: bool) -> Iterator[tuple]:
+        # Gerador determinístico: as duas passadas (ativos e arquivados) usam a mesma sequência de sorteios
+        rows_rng = random.Random(seed)
+        for employee_id in range(1, employees + 1):
+            if employee_id <= departments:
+                department, position, is_archived = employee_id, 1, False
+            else:
+                department = rows_rng.randint(1, departments)
+                position = rows_rng.randint(2, jobs_per_department)
+                is_archived = rows_rng.random() < archived_ratio
+            name = rows_rng.choice(first_names)
+            last_name = rows_rng.choice(last_names)
+            salary = round(rows_rng.uniform(1500, 20000), 2)
+            if is_archived != archived:
+                continue
+            yield (
+                employee_id,
+                name,
+                last_name,
+                "%09d" % employee_id,
+                job_id(department, position),
+                department,
+                salary,
+                "archived" if archived else "active",
+                employee_id <= departments,
+            )
+
+    employee_columns = (
+        "id", "name", "last_name", "register_number", "job_id", "department_id", "salary", "status", "is_leader",
+    )
+    counts = {}
+    start = time.perf_counter()
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute('SELECT EXISTS (SELECT 1 FROM department) OR EXISTS (SELECT 1 FROM "user")')
+        if cursor.fetchone()[0]:
+            raise ValueError("O banco já possui dados. Use --truncate para substituí-los.")
+
+        for table in TABLES:
+            cursor.execute('ALTER TABLE "%s" DISABLE TRIGGER USER' % table)
+        indexes = _drop_secondary_indexes(cursor, INDEXED_TABLES)
+
+        counts["department"] = _copy(cursor, "department", ("id", "name"), (
+            (department, "Departamento %s" % department) for department in range(1, departments + 1)
+        ), chunk_size)
+        counts["job"] = _copy(cursor, "job", ("id", "name", "code", "department_id", "is_leadership"), (
+            (job_id(department, position), "Cargo %s" % job_id(department, position),
+             _job_code(job_id(department, position)), department, position == 1)
+            for department in range(1, departments + 1)
+            for position in range(1, jobs_per_department + 1)
+        ), chunk_size)
+        counts["employee"] = _copy(cursor, "employee", employee_columns, employee_rows(False), chunk_size)
+        counts["employee_archive"] = _copy(
+            cursor, "employee_archive", employee_columns, employee_rows(True), chunk_size)
+
+        # Usuários associados a colaboradores ativos distintos, sorteados entre os IDs carregados
+        cursor.execute("SELECT id FROM employee ORDER BY id")
+        active_ids = [row[0] for row in cursor.fetchall()]
+        owners = sorted(rng.sample(active_ids, min(users, len(active_ids))))
+        counts["user"] = _copy(cursor, "user", ("id", "login", "passw", "employee_id"), (
+            (user_id, "user%s@company.com.br" % user_id, "%032x" % rng.getrandbits(128), employee_id)
+            for user_id, employee_id in enumerate(owners, start=1)
+        ), chunk_size)
+
+        # Líderes dos departamentos, estatísticas e sequências dos IDs gerados explicitamente
+        cursor.execute("UPDATE department SET leader_id = id")
+        for statement in REBUILD_STATS:
+            cursor.execute(statement)
+        for table, value in (("department", departments), ("job", departments * jobs_per_department),
+                             ("employee", employees), ("user", counts["user"])):
+            cursor.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), %s)", ('"%s"' % table, max(value, 1)))
+
+        for definition in indexes:
+            cursor.execute(definition)
+        for table in TABLES:
+            cursor.execute('ALTER TABLE "%s" ENABLE TRIGGER USER' % table)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as autocommit:
+        autocommit.exec_driver_sql("VACUUM ANALYZE")
+
+    _logger.info("Carga concluída em %.1fs: %s" % (time.perf_counter() - start, counts))
+    return counts
+
+def truncate(engine: Engine) -> None:
+    """
+        Remove todos os dados das tabelas carregadas pelo gerador.
+    """
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "TRUNCATE %s RESTART IDENTITY CASCADE" % ", ".join('"%s"' % table for table in TABLES))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Gera um conjunto de dados sintético (departamentos, cargos, colaboradores e usuários) "
+                    "e o carrega com COPY no banco configurado pelas variáveis POSTGRES_*."
+    )
+    parser.add_argument("--departments", type=int, default=2000, help="Quantidade de departamentos.")
+    parser.add_argument("--jobs-per-department", type=int, default=4,
+                        help="Cargos por departamento, o primeiro é de liderança.")
+    parser.add_argument("--employees", type=int, default=1000000, help="Quantidade de colaboradores.")
+    parser.add_argument("--users", type=int, default=100000, help="Quantidade de usuários.")
+    parser.add_argument("--archived-ratio", type=float, default=0.1, help="Fração de colaboradores arquivados.")
+    parser.add_argument("--seed", type=int, default=42, help="Semente que torna o conjunto reproduzível.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Linhas por bloco do COPY.")
+    parser.add_argument("--database", help="Nome do banco de destino, por padrão POSTGRES_DB.")
+    parser.add_argument("--truncate", action="store_true", help="Remove os dados existentes antes da carga.")
+    args = parser.parse_args()
+
+    url = get_database_url()
+    if args.database:
+        url = "%s/%s" % (url.rsplit("/", 1)[0], args.database)
+    engine = create_engine(url)
+    try:
+        if args.truncate:
+            truncate(engine)
+        generate(engine, args.departments, args.jobs_per_department, args.employees, args.users,
+                 args.archived_ratio, args.seed, args.chunk_size)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,344 @@
+-- Regras do banco de dados (funções, triggers e índices). O arquivo pode ser executado novamente em um banco
+-- existente: é aplicado na criação pelo app.database.bootstrap e nas atualizações pelo app.database.migrate.
+
+-- Trigger na tabela EMPLOYEE para validar o cargo e preencher o departamento do colaborador
+-- A busca acontece dentro do próprio INSERT/UPDATE, sem uma ida extra ao banco pela aplicação.
+CREATE OR REPLACE FUNCTION set_employee_department()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT department_id INTO NEW.department_id FROM job WHERE id = NEW.job_id;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Cargo inválido.';
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER set_employee_department_insert
+BEFORE INSERT ON employee
+FOR EACH ROW
+EXECUTE FUNCTION set_employee_department();
+
+-- Na atualização, a busca só acontece quando o cargo realmente foi alterado
+CREATE OR REPLACE TRIGGER set_employee_department_update
+BEFORE UPDATE OF job_id ON employee
+FOR EACH ROW
+WHEN (NEW.job_id IS DISTINCT FROM OLD.job_id)
+EXECUTE FUNCTION set_employee_department();
+
 -- Trigger na tabela EMPLOYEE para tornar um colaborador líder de um departamento
+-- A trigger é por instrução: as linhas inseridas ou que mudaram de cargo chegam pelas transition tables e as
+-- validações são feitas uma única vez para todo o lote, em vez de uma vez por linha.
 CREATE OR REPLACE FUNCTION enforce_leadership_rules()
 RETURNS TRIGGER AS $$
+DECLARE
+    leaders INTEGER[];
 BEGIN
-    -- Verifica se o cargo é de liderança
-    IF (SELECT is_leadership FROM job WHERE id = NEW.job_id) THEN
-        -- Impede que mais de um colaborador tenha o mesmo cargo de liderança
-        IF EXISTS (
-            SELECT 1 FROM employee
-            WHERE job_id = NEW.job_id AND id != NEW.id
-        ) THEN
-            RAISE EXCEPTION 'O cargo de liderança já está ocupado.';
-        END IF;
+    -- Colaboradores que assumiram um cargo de liderança nesta instrução
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(n.id) INTO leaders
+        FROM new_rows n
+        JOIN job j ON j.id = n.job_id
+        WHERE j.is_leadership;
+    ELSE
+        SELECT array_agg(n.id) INTO leaders
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN job j ON j.id = n.job_id
+        WHERE j.is_leadership AND n.job_id IS DISTINCT FROM o.job_id;
+    END IF;
 
-        -- Atualiza o líder do departamento e o campo is_leader
-        UPDATE department SET leader_id = NEW.id WHERE id = NEW.department_id;
+    IF leaders IS NULL THEN
+        RETURN NULL;
     END IF;
 
-    RETURN NEW;
+    -- Impede que mais de um colaborador tenha o mesmo cargo de liderança (utiliza o índice ix_employee_job_id)
+    IF EXISTS (
+        SELECT 1
+        FROM employee
+        WHERE job_id IN (SELECT job_id FROM employee WHERE id = ANY(leaders))
+        GROUP BY job_id
+        HAVING COUNT(*) > 1
+    ) THEN
+        RAISE EXCEPTION 'O cargo de liderança já está ocupado.';
+    END IF;
+
+    -- Atualiza o líder de cada departamento afetado e o campo is_leader (pela trigger sync_is_leader)
+    UPDATE department d
+    SET leader_id = l.id
+    FROM (
+        SELECT DISTINCT ON (department_id) id, department_id
+        FROM employee
+        WHERE id = ANY(leaders)
+        ORDER BY department_id, id DESC
+    ) l
+    WHERE d.id = l.department_id AND d.leader_id IS DISTINCT FROM l.id;
+
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER enforce_leadership_trigger
-AFTER INSERT OR UPDATE OF job_id ON employee
-FOR EACH ROW
-EXECUTE FUNCTION enforce_leadership_rules();
+CREATE OR REPLACE TRIGGER enforce_leadership_insert
+AFTER INSERT ON employee
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION enforce_leadership_rules();
+
+-- Transition tables não permitem "UPDATE OF job_id", por isso a mudança de cargo é verificada na função
+CREATE OR REPLACE TRIGGER enforce_leadership_update
+AFTER UPDATE ON employee
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION enforce_leadership_rules();
 
 -- Trigger na tabela DEPARMENT para para atualizar o campo is_leader na tabela employee
 CREATE OR REPLACE FUNCTION sync_is_leader()
 RETURNS TRIGGER AS $$
 BEGIN
-    -- Marca como líder o funcionário associado ao leader_id
+    -- Marca como líder o funcionário associado ao leader_id e desmarca o líder anterior.
+    -- Somente essas duas linhas são alteradas, e apenas se o valor de is_leader realmente mudar.
     UPDATE employee
-    SET is_leader = (id = NEW.leader_id)
-    WHERE department_id = NEW.id;
+    SET is_leader = COALESCE(id = NEW.leader_id, FALSE)
+    WHERE id IN (OLD.leader_id, NEW.leader_id)
+      AND department_id = NEW.id
+      AND is_leader IS DISTINCT FROM COALESCE(id = NEW.leader_id, FALSE);
 
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER sync_is_leader
+CREATE OR REPLACE TRIGGER sync_is_leader
 AFTER UPDATE OF leader_id ON department
-FOR EACH ROW EXECUTE FUNCTION sync_is_leader();
+FOR EACH ROW
+WHEN (OLD.leader_id IS DISTINCT FROM NEW.leader_id)
+EXECUTE FUNCTION sync_is_leader();
+
+-- Índices da busca aproximada por nome e sobrenome e da busca pelo início da matrícula (GET /employees/search)
+-- Os nomes se repetem muito entre os colaboradores, então a similaridade é calculada sobre os nomes completos distintos
+-- (employee_search_name, mantida pela sync_employee_stats abaixo) e não sobre cada colaborador. Os colaboradores de
+-- cada nome encontrado são lidos em ordem de ID pelo ix_employee_full_name, cuja expressão precisa ser idêntica à
+-- montada em crud._employee_full_name para que o índice seja utilizado.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_employee_search_name_trgm ON employee_search_name
+USING gin (full_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_employee_full_name ON employee ((name || ' ' || last_name), id);
+
+-- Com a collation "C", o índice atende o LIKE 'prefixo%' e a ordem das matrículas em qualquer collation do banco
+CREATE INDEX IF NOT EXISTS ix_employee_register_number_prefix ON employee ((register_number COLLATE "C"));
+
+-- Totais de colaboradores ativos, líderes e folha salarial por departamento e por cargo, e colaboradores ativos por nome
+-- completo (busca). As triggers são por instrução e recebem as linhas alteradas (transition tables), então cada
+-- INSERT/UPDATE/DELETE aplica apenas a diferença nos totais, sem varrer a tabela employee.
+CREATE OR REPLACE FUNCTION sync_employee_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    deltas TEXT;
+BEGIN
+    -- Linhas novas somam nos totais e linhas antigas subtraem, considerando apenas colaboradores ativos.
+    -- Cada operação tem transition tables diferentes, por isso a origem das diferenças é montada como SQL dinâmico.
+    deltas := CASE TG_OP
+        WHEN 'INSERT' THEN
+            'SELECT department_id, job_id, name || '' '' || last_name AS full_name, 1 AS headcount,
+                    is_leader::INTEGER AS leaders, salary
+             FROM new_rows WHERE status = ''active'''
+        WHEN 'UPDATE' THEN
+            'SELECT department_id, job_id, name || '' '' || last_name AS full_name, 1 AS headcount,
+                    is_leader::INTEGER AS leaders, salary
+             FROM new_rows WHERE status = ''active''
+             UNION ALL
+             SELECT department_id, job_id, name || '' '' || last_name, -1, -is_leader::INTEGER, -salary
+             FROM old_rows WHERE status = ''active'''
+        ELSE
+            'SELECT department_id, job_id, name || '' '' || last_name AS full_name, -1 AS headcount,
+                    -is_leader::INTEGER AS leaders, -salary AS salary
+             FROM old_rows WHERE status = ''active'''
+    END;
+
+    -- As diferenças são agregadas por departamento e por cargo direto das transition tables, e os grupos sem
+    -- alteração líquida (ex.: troca de cargo dentro do mesmo departamento) não são gravados
+    EXECUTE format(
+        'INSERT INTO department_stats (department_id, active_headcount, leader_count, salary_sum)
+         SELECT department_id, SUM(headcount), SUM(leaders), SUM(salary)
+         FROM (%s) deltas
+         WHERE department_id IS NOT NULL
+         GROUP BY department_id
+         HAVING SUM(headcount) <> 0 OR SUM(leaders) <> 0 OR SUM(salary) <> 0
+         ORDER BY department_id
+         ON CONFLICT (department_id) DO UPDATE SET
+             active_headcount = department_stats.active_headcount + EXCLUDED.active_headcount,
+             leader_count = department_stats.leader_count + EXCLUDED.leader_count,
+             salary_sum = department_stats.salary_sum + EXCLUDED.salary_sum',
+        deltas
+    );
+
+    EXECUTE format(
+        'INSERT INTO job_stats (job_id, active_headcount, leader_count, salary_sum)
+         SELECT job_id, SUM(headcount), SUM(leaders), SUM(salary)
+         FROM (%s) deltas
+         GROUP BY job_id
+         HAVING SUM(headcount) <> 0 OR SUM(leaders) <> 0 OR SUM(salary) <> 0
+         ORDER BY job_id
+         ON CONFLICT (job_id) DO UPDATE SET
+             active_headcount = job_stats.active_headcount + EXCLUDED.active_headcount,
+             leader_count = job_stats.leader_count + EXCLUDED.leader_count,
+             salary_sum = job_stats.salary_sum + EXCLUDED.salary_sum',
+        deltas
+    );
+
+    -- Contagem de colaboradores ativos por nome completo, e os nomes que ficaram sem colaboradores são removidos
+    EXECUTE format(
+        'INSERT INTO employee_search_name (full_name, headcount)
+         SELECT full_name, SUM(headcount)
+         FROM (%s) deltas
+         GROUP BY full_name
+         HAVING SUM(headcount) <> 0
+         ORDER BY full_name
+         ON CONFLICT (full_name) DO UPDATE SET
+             headcount = employee_search_name.headcount + EXCLUDED.headcount',
+        deltas
+    );
+
+    EXECUTE format(
+        'DELETE FROM employee_search_name
+         WHERE headcount = 0 AND full_name IN (SELECT full_name FROM (%s) deltas)',
+        deltas
+    );
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER employee_stats_insert
+AFTER INSERT ON employee
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_stats();
+
+CREATE OR REPLACE TRIGGER employee_stats_update
+AFTER UPDATE ON employee
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_stats();
+
+CREATE OR REPLACE TRIGGER employee_stats_delete
+AFTER DELETE ON employee
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_stats();
+
+-- Colaboradores arquivados são movidos para a tabela employee_archive, mantendo o mesmo ID
+-- Assim a tabela employee e seus índices contêm apenas os ativos, e as consultas e triggers do dia a dia não
+-- percorrem o histórico. A trigger é por instrução, então um arquivamento em lote move todas as linhas de uma vez.
+-- O líder arquivado deixa o departamento pela chave estrangeira department.leader_id (ON DELETE SET NULL), e o usuário
+-- continua vinculado ao colaborador (check_user_employee e release_user_employee, abaixo).
+CREATE OR REPLACE FUNCTION archive_employees()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO employee_archive (id, name, last_name, register_number, job_id, department_id, salary, status, is_leader)
+    SELECT id, name, last_name, register_number, job_id, department_id, salary, status, FALSE
+    FROM new_rows
+    WHERE status = 'archived';
+
+    IF FOUND THEN
+        DELETE FROM employee e
+        USING new_rows n
+        WHERE e.id = n.id AND n.status = 'archived';
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER archive_employees_insert
+AFTER INSERT ON employee
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION archive_employees();
+
+CREATE OR REPLACE TRIGGER archive_employees_update
+AFTER UPDATE ON employee
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION archive_employees();
+
+-- Matrícula única entre os ativos e os arquivados
+-- Cada tabela tem a própria restrição unique, e a trigger verifica a outra tabela. Durante o arquivamento a mesma linha
+-- está nas duas (mesmo ID), por isso ela é ignorada. O lock da matrícula serializa as transações que gravam a mesma
+-- matrícula nas duas tabelas, que de outra forma não veriam a linha ainda não confirmada uma da outra.
+CREATE OR REPLACE FUNCTION check_register_number()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('register_number:' || NEW.register_number));
+
+    IF TG_TABLE_NAME = 'employee' THEN
+        PERFORM 1 FROM employee_archive WHERE register_number = NEW.register_number AND id <> NEW.id;
+    ELSE
+        PERFORM 1 FROM employee WHERE register_number = NEW.register_number AND id <> NEW.id;
+    END IF;
+    IF FOUND THEN
+        RAISE EXCEPTION 'Matrícula % já cadastrada.', NEW.register_number USING ERRCODE = 'unique_violation';
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER check_register_number
+BEFORE INSERT OR UPDATE OF register_number ON employee
+FOR EACH ROW
+EXECUTE FUNCTION check_register_number();
+
+CREATE OR REPLACE TRIGGER check_register_number
+BEFORE INSERT OR UPDATE OF register_number ON employee_archive
+FOR EACH ROW
+EXECUTE FUNCTION check_register_number();
+
+-- Vínculo do usuário com o colaborador (user.employee_id)
+-- Não é uma chave estrangeira para employee porque o cadastro do colaborador arquivado é movido para employee_archive,
+-- e o usuário precisa continuar vinculado a ele. A existência do colaborador é validada nas duas tabelas, travando a
+-- linha encontrada (FOR KEY SHARE) como uma chave estrangeira faria.
+CREATE OR REPLACE FUNCTION check_user_employee()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.employee_id IS NULL THEN
+        RETURN NEW;
+    END IF;
+
+    PERFORM 1 FROM employee WHERE id = NEW.employee_id FOR KEY SHARE;
+    IF NOT FOUND THEN
+        PERFORM 1 FROM employee_archive WHERE id = NEW.employee_id FOR KEY SHARE;
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'Colaborador % não encontrado.', NEW.employee_id USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER check_user_employee
+BEFORE INSERT OR UPDATE OF employee_id ON "user"
+FOR EACH ROW
+EXECUTE FUNCTION check_user_employee();
+
+-- Quando o colaborador é excluído de verdade, o usuário é desvinculado. Um colaborador que apenas mudou de tabela
+-- (arquivamento) continua existindo na outra e mantém o vínculo.
+CREATE OR REPLACE FUNCTION release_user_employee()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE "user" u
+    SET employee_id = NULL
+    FROM old_rows o
+    WHERE u.employee_id = o.id
+      AND NOT EXISTS (SELECT 1 FROM employee WHERE id = o.id)
+      AND NOT EXISTS (SELECT 1 FROM employee_archive WHERE id = o.id);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER release_user_employee
+AFTER DELETE ON employee
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION release_user_employee();
+
+CREATE OR REPLACE TRIGGER release_user_employee
+AFTER DELETE ON employee_archive
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION release_user_employee();
@@ -0,0 +1,55 @@
+try:
+    import os
+    import logging
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.sql import text
+    from app.database.base import Base
+    from app.database.bootstrap import wait_for_database
+    from app.database.conn import get_database_url
+    from app import models # Registra todos os modelos no metadata antes do create_all
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+# Aplicados em ordem: as regras atuais (init.sql, que pode ser executado novamente) e depois os ajustes e as cargas
+# de dados que só fazem sentido em um banco criado por uma versão anterior (migrate.sql).
+SQL_FILES = ("init.sql", "migrate.sql")
+
+
+def migrate(engine: Engine) -> None:
+    """
+        Atualiza um banco de dados já existente para o esquema atual: cria as tabelas novas, reaplica as regras do
+        init.sql e executa o migrate.sql.
+
+        Tudo acontece em uma única transação, então as triggers novas e as cargas iniciais (totais por departamento,
+        colaboradores arquivados) passam a valer juntas, sem que uma escrita concorrente fique fora dos totais.
+        Pode ser executado mais de uma vez.
+
+        Args:
+            engine: Engine síncrona do banco de dados.
+    """
+
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        for file_name in SQL_FILES:
+            with open(os.path.join(os.path.dirname(__file__), file_name), "r") as file:
+                connection.execute(text(file.read()))
+            _logger.info("Arquivo SQL %s aplicado!" % file_name)
+    _logger.info("Banco de dados atualizado com sucesso!")
+
+def main() -> None:
+    engine = create_engine(get_database_url())
+    try:
+        if not wait_for_database(engine):
+            raise SystemExit("O banco de dados não existe. Execute python -m app.database.bootstrap para criá-lo.")
+        migrate(engine)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+-- Ajustes de um banco criado por uma versão anterior, aplicados por python -m app.database.migrate depois do init.sql
+-- Todas as instruções podem ser executadas novamente sem efeito.
+
+-- A trigger por linha da liderança foi substituída pelas triggers por instrução enforce_leadership_insert/update.
+-- Mantida, ela chamaria a nova função sem as transition tables ("relation new_rows does not exist").
+DROP TRIGGER IF EXISTS enforce_leadership_trigger ON employee;
+
+-- Os totais por departamento e por cargo passaram a ser agregados direto das transition tables, sem o tipo auxiliar
+DROP FUNCTION IF EXISTS apply_employee_stats(employee_stats_delta[]);
+DROP TYPE IF EXISTS employee_stats_delta;
+
+-- Carga inicial dos totais a partir dos colaboradores que já existem
+INSERT INTO department_stats (department_id, active_headcount, leader_count, salary_sum)
+SELECT department_id, COUNT(*), COUNT(*) FILTER (WHERE is_leader), SUM(salary)
+FROM employee
+WHERE status = 'active' AND department_id IS NOT NULL
+GROUP BY department_id
+ON CONFLICT (department_id) DO NOTHING;
+
+INSERT INTO job_stats (job_id, active_headcount, leader_count, salary_sum)
+SELECT job_id, COUNT(*), COUNT(*) FILTER (WHERE is_leader), SUM(salary)
+FROM employee
+WHERE status = 'active'
+GROUP BY job_id
+ON CONFLICT (job_id) DO NOTHING;
+
+-- A busca passou a pontuar os nomes completos distintos (employee_search_name) em vez de cada colaborador
+DROP INDEX IF EXISTS ix_employee_search_trgm;
+DROP INDEX IF EXISTS ix_employee_search_gist;
+
+INSERT INTO employee_search_name (full_name, headcount)
+SELECT name || ' ' || last_name, COUNT(*)
+FROM employee
+WHERE status = 'active'
+GROUP BY name || ' ' || last_name
+ON CONFLICT (full_name) DO NOTHING;
+
+-- Colaboradores arquivados ficam em employee_archive. O líder arquivado libera o departamento (ON DELETE SET NULL),
+-- e o vínculo do usuário deixa de ser uma chave estrangeira para employee (ver check_user_employee no init.sql).
+ALTER TABLE "user" DROP CONSTRAINT IF EXISTS user_employee_id_fkey;
+ALTER TABLE department DROP CONSTRAINT IF EXISTS department_leader_id_fkey;
+ALTER TABLE department ADD CONSTRAINT department_leader_id_fkey
+FOREIGN KEY (leader_id) REFERENCES employee (id) ON DELETE SET NULL;
+
+-- Com apenas os ativos na tabela employee, o status não faz mais parte dos índices da listagem
+DROP INDEX IF EXISTS ix_employee_active_id;
+DROP INDEX IF EXISTS ix_employee_department_id_status;
+CREATE INDEX IF NOT EXISTS ix_employee_department_id ON employee (department_id, id);
+CREATE INDEX IF NOT EXISTS ix_employee_job_id ON employee (job_id, id);
+
+-- Move os colaboradores que já estavam arquivados
+INSERT INTO employee_archive (id, name, last_name, register_number, job_id, department_id, salary, status, is_leader)
+SELECT id, name, last_name, register_number, job_id, department_id, salary, status, FALSE
+FROM employee
+WHERE status = 'archived'
+ON CONFLICT (id) DO NOTHING;
+
+DELETE FROM employee WHERE status = 'archived';
+
+-- A matrícula passou a ser única também entre os arquivados (ver check_register_number no init.sql). Se houver
+-- matrículas repetidas a migração falha sem alterar o banco, e elas precisam ser corrigidas antes.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'employee_archive_register_number_key') THEN
+        DROP INDEX IF EXISTS ix_employee_archive_register_number;
+        ALTER TABLE employee_archive ADD CONSTRAINT employee_archive_register_number_key UNIQUE (register_number);
+    END IF;
+
+    IF EXISTS (
+        SELECT 1
+        FROM employee e
+        JOIN employee_archive a ON a.register_number = e.register_number AND a.id <> e.id
+    ) THEN
+        RAISE EXCEPTION 'Há matrículas cadastradas em employee e em employee_archive.';
+    END IF;
+END $$;
@@ -0,0 +1,67 @@
+try:
+    import time
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """
+        Pool de conexões assíncrono que acumula quantas conexões foram solicitadas, o tempo total de espera
+        na fila até cada conexão ser entregue e quantas solicitações estouraram o pool_timeout.
+
+        Quando a solicitação abre uma conexão nova (dentro do max_overflow), o tempo de conexão com o servidor
+        não é contado como espera.
+    """
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.timeouts = 0
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        # Lido (e removido) pelo _do_get que abriu a conexão
+        record.info["connect_time"] = time.perf_counter() - start
+        return record
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connect_time = 0.0
+        try:
+            record = super()._do_get()
+            connect_time = record.info.pop("connect_time", 0.0)
+            return record
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.checkouts += 1
+            self.wait_time_total += time.perf_counter() - start - connect_time
+
+
+def pool_status(pool: MonitoredQueuePool) -> dict:
+    """
+        Monta um retrato do uso atual do pool de conexões.
+
+        Args:
+            pool: Pool de conexões da engine.
+
+        Returns:
+            dict: Contadores de conexões em uso, ociosas, em overflow e o tempo acumulado de espera na fila.
+    """
+
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool.max_overflow,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": pool.checkouts,
+        "wait_time_total": pool.wait_time_total,
+        "timeouts": pool.timeouts,
+    }
@@ -0,0 +1,26 @@
+try:
+    import os
+    from typing import Optional
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+        Lê uma variável de ambiente, tratando o valor vazio como ausente.
+
+        O docker-compose repassa as variáveis que não estão no .env como texto vazio ("DB_POOL_SIZE: $DB_POOL_SIZE"),
+        então um .env sem as configurações opcionais deve manter os valores padrão em vez de quebrar a conversão.
+
+        Args:
+            name: Nome da variável.
+            default: Valor usado quando a variável não existe ou está vazia.
+
+        Returns:
+            Optional[str]: Valor da variável ou o padrão.
+    """
+
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value
@@ -1,7 +1,13 @@
 try:
     import logging
-    from fastapi import FastAPI
-    from app.routers import employee, department, job, user
+    from fastapi import FastAPI, HTTPException
+    from fastapi.responses import PlainTextResponse
+    from sqlalchemy.sql import text
+    from app.database import conn
+    from app.database.conn import get_async_engine, get_read_engine
+    from app.database.pool import pool_status
+    from app.monitoring import metrics, profiling
+    from app.routers import employee, department, job, user, internal
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
@@ -10,14 +16,54 @@ logging.basicConfig(level=logging.INFO)
 _logger = logging.getLogger(__name__)
 
 app = FastAPI()
-
+app.add_middleware(metrics.MetricsMiddleware)
+if profiling.PROFILING_TOKEN:
+    # Registrado apenas com token configurado, para não acrescentar nada às requisições quando o profiling está desligado
+    app.add_middleware(profiling.ProfilingMiddleware)
+    _logger.info("Profiling por requisição habilitado!")
 
 app.include_router(employee.router, prefix="/employees", tags=["Employees"])
 app.include_router(department.router, prefix="/departments", tags=["Department"])
 app.include_router(job.router, prefix="/jobs", tags=["Job"])
 app.include_router(user.router, prefix="/users", tags=["User"])
+app.include_router(internal.router, prefix="/internal", tags=["Internal"])
 _logger.info("Rotas estabelecidas!")
 
 @app.get("/")
 def read_root():
-    return {"message": "API is running"}
\ No newline at end of file
+    return {"message": "API is running"}
+
+@app.get("/ready")
+async def readiness_route():
+    """
+        Rota de prontidão do worker: só responde com sucesso quando o pool consegue entregar uma conexão.
+
+        Returns:
+            dict: Mensagem informando que o worker está pronto.
+    """
+
+    try:
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as error:
+        _logger.warning("Banco de dados indisponível: %s" % error)
+        raise HTTPException(status_code=503, detail="Banco de dados indisponível")
+    return {"message": "ready"}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_route():
+    """
+        Métricas deste worker no formato do Prometheus: latência por rota e status, tempo de banco por requisição,
+        requisições em andamento e uso dos pools de conexões.
+
+        Returns:
+            PlainTextResponse: Métricas no formato texto do Prometheus.
+    """
+
+    pools = {"primary": pool_status(get_async_engine().pool)}
+    if conn.POSTGRES_REPLICA_HOST:
+        pools["replica"] = pool_status(get_read_engine().pool)
+    return PlainTextResponse(
+        metrics.render(metrics.render_pool_status(pools)),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -1,4 +1,5 @@
 from . import job
 from . import department
 from . import employee
-from . import user
\ No newline at end of file
+from . import user
+from . import stats
\ No newline at end of file
@@ -22,7 +22,8 @@ class Department(Base):
     )
     leader_id = Column(
         Integer,
-        ForeignKey("employee.id"),
+        # Liberado automaticamente quando o líder é excluído ou arquivado
+        ForeignKey("employee.id", ondelete="SET NULL"),
     )
 
     leader = relationship(
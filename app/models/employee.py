@@ -1,6 +1,6 @@
 try:
     import enum
-    from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean, Enum
+    from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean, Enum, FetchedValue, Index, DateTime, func
     from sqlalchemy.orm import relationship
     from sqlalchemy import event
     from sqlalchemy.orm import Session, validates
@@ -19,6 +19,13 @@ class StateEnum(enum.Enum):
 class Employee(Base):
     __tablename__ = "employee"
     _description = "Instância do modelo que se refere aos cadastros dos colaboradores."
+    # Índices dos filtros da listagem. O id no final permite que a paginação por cursor
+    # seja resolvida no próprio índice, sem ordenar os registros filtrados. A tabela contém apenas
+    # os ativos (os arquivados ficam em employee_archive), então o status não faz parte dos índices.
+    __table_args__ = (
+        Index("ix_employee_department_id", "department_id", "id"),
+        Index("ix_employee_job_id", "job_id", "id"),
+    )
 
     id = Column(
         Integer,
@@ -43,9 +50,12 @@ class Employee(Base):
         ForeignKey("job.id"),
         nullable=False
     )
+    # Preenchido pela trigger set_employee_department a partir do cargo (init.sql)
     department_id = Column(
         Integer,
-        ForeignKey("department.id")
+        ForeignKey("department.id"),
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
     )
     salary = Column(
         Float,
@@ -69,3 +79,70 @@ class Employee(Base):
         nullable=False,
         default=False
     )
+
+
+class EmployeeArchive(Base):
+    __tablename__ = "employee_archive"
+    _description = ("Histórico dos colaboradores arquivados. As linhas são movidas da tabela employee pela trigger "
+                    "archive_employees (init.sql), mantendo o mesmo ID.")
+    __table_args__ = (
+        Index("ix_employee_archive_department_id", "department_id", "id"),
+        Index("ix_employee_archive_job_id", "job_id", "id"),
+    )
+
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=False
+    )
+    name = Column(
+        String,
+        nullable=False
+    )
+    last_name = Column(
+        String,
+        nullable=False
+    )
+    # Única também em relação aos ativos (trigger check_register_number, init.sql)
+    register_number = Column(
+        String,
+        unique=True,
+        nullable=False
+    )
+    job_id = Column(
+        Integer,
+        ForeignKey("job.id"),
+        nullable=False
+    )
+    department_id = Column(
+        Integer,
+        ForeignKey("department.id")
+    )
+    salary = Column(
+        Float,
+        nullable=False
+    )
+    status = Column(
+        Enum(StateEnum),
+        nullable=False,
+        default=StateEnum.archived
+    )
+    is_leader = Column(
+        Boolean,
+        nullable=False,
+        default=False
+    )
+    archived_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now()
+    )
+
+    job = relationship(
+        "Job",
+        foreign_keys=[job_id]
+    )
+    department = relationship(
+        "Department",
+        foreign_keys=[department_id]
+    )
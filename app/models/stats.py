@@ -0,0 +1,82 @@
+try:
+    from sqlalchemy import Column, Integer, Float, ForeignKey, String
+    from app.database.base import Base
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+class DepartmentStats(Base):
+    __tablename__ = "department_stats"
+    _description = "Totais dos colaboradores ativos de cada departamento, mantidos pelas triggers do init.sql."
+
+    department_id = Column(
+        Integer,
+        ForeignKey("department.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    active_headcount = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    leader_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    salary_sum = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default="0"
+    )
+
+
+class JobStats(Base):
+    __tablename__ = "job_stats"
+    _description = "Totais dos colaboradores ativos de cada cargo, mantidos pelas triggers do init.sql."
+
+    job_id = Column(
+        Integer,
+        ForeignKey("job.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    active_headcount = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    leader_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    salary_sum = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default="0"
+    )
+
+
+class EmployeeSearchName(Base):
+    __tablename__ = "employee_search_name"
+    _description = (
+        "Nomes completos distintos dos colaboradores ativos, com a quantidade de colaboradores de cada um, mantidos "
+        "pelas triggers do init.sql. A busca aproximada pontua estes nomes em vez de cada colaborador."
+    )
+
+    full_name = Column(
+        String,
+        primary_key=True
+    )
+    headcount = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
@@ -23,13 +23,15 @@ class User(Base):
         String,
         nullable=False
     )
+    # Sem chave estrangeira para employee: o colaborador arquivado é movido para employee_archive e o usuário
+    # continua vinculado a ele. A existência é validada pela trigger check_user_employee (init.sql).
     employee_id = Column(
         Integer,
-        ForeignKey("employee.id"),
         unique=True
     )
 
     employee = relationship(
         "Employee",
-        foreign_keys=[employee_id]
+        primaryjoin="foreign(User.employee_id) == Employee.id",
+        viewonly=True
     )
\ No newline at end of file
@@ -0,0 +1,267 @@
+try:
+    import os
+    import time
+    from bisect import bisect_left
+    from contextvars import ContextVar
+    from typing import Dict, Optional, Tuple
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Limites (em segundos) dos buckets dos histogramas de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Limites dos buckets do histograma de instruções SQL por requisição
+STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# Rótulo das requisições que não correspondem a nenhuma rota, para não criar uma série por URL desconhecida
+UNMATCHED_ROUTE = "unmatched"
+
+# Cada worker do uvicorn mantém os próprios números, identificados pelo PID nas séries exportadas
+WORKER = str(os.getpid())
+
+# Campos acumulados do retrato do pool de conexões, exportados como contadores. Os demais são gauges.
+POOL_COUNTERS = {
+    "checkouts": ("db_pool_checkouts_total", "counter"),
+    "wait_time_total": ("db_pool_wait_seconds_total", "counter"),
+    "timeouts": ("db_pool_timeouts_total", "counter"),
+}
+
+
+class RequestStats:
+    """
+        Totais de uma requisição em andamento, preenchidos pelos eventos da engine (conn.py).
+    """
+
+    __slots__ = ("method", "path", "db_time", "statements", "statement_counts")
+
+    def __init__(self, method: str = "", path: str = ""):
+        self.method = method
+        self.path = path
+        self.db_time = 0.0
+        self.statements = 0
+        # Execuções de cada instrução (pelo texto SQL) na requisição, usadas na detecção de N+1
+        self.statement_counts: Dict[str, int] = {}
+
+
+# Estatísticas da requisição atual. O contexto é propagado pelo SQLAlchemy até os eventos síncronos da engine.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """
+        Estatísticas da requisição atual, ou None fora de uma requisição (bootstrap, scripts).
+    """
+
+    return _request_stats.get()
+
+
+class Histogram:
+    """
+        Histograma por conjunto de rótulos. Cada observação incrementa apenas o seu bucket, os valores
+        acumulados do formato Prometheus são calculados na exportação.
+    """
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        self.series: Dict[tuple, list] = {}
+
+    def observe(self, label_values: tuple, value: float) -> None:
+        series = self.series.get(label_values)
+        if series is None:
+            # Contagem de cada bucket (o último é o +Inf), soma e quantidade de observações
+            series = self.series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list:
+        lines = [
+            "# HELP %s %s" % (self.name, self.description),
+            "# TYPE %s histogram" % self.name,
+        ]
+        for label_values, (counts, total, count) in sorted(self.series.items()):
+            labels = _format_labels(self.labels, label_values)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                lines.append('%s_bucket{%s,le="%s"} %s' % (
+                    self.name, labels, "+Inf" if bound == float("inf") else repr(bound), cumulative))
+            lines.append("%s_sum{%s} %r" % (self.name, labels, total))
+            lines.append("%s_count{%s} %s" % (self.name, labels, count))
+        return lines
+
+
+class Gauge:
+    """
+        Valor instantâneo por conjunto de rótulos.
+    """
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...]):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.series: Dict[tuple, float] = {}
+
+    def add(self, label_values: tuple, value: float) -> None:
+        self.series[label_values] = self.series.get(label_values, 0) + value
+
+    def render(self) -> list:
+        lines = [
+            "# HELP %s %s" % (self.name, self.description),
+            "# TYPE %s gauge" % self.name,
+        ]
+        for label_values, value in sorted(self.series.items()):
+            lines.append("%s{%s} %r" % (self.name, _format_labels(self.labels, label_values), value))
+        return lines
+
+
+def _format_labels(names: Tuple[str, ...], values: tuple) -> str:
+    labels = zip(("worker",) + names, (WORKER,) + values)
+    return ",".join('%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"')) for name, value in labels)
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Tempo de resposta das requisições, por rota e status.",
+    ("method", "route", "status"),
+    LATENCY_BUCKETS,
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Tempo gasto no banco de dados em cada requisição, por rota.",
+    ("method", "route"),
+    LATENCY_BUCKETS,
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "Quantidade de instruções SQL executadas em cada requisição, por rota.",
+    ("method", "route"),
+    STATEMENT_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requisições em andamento neste worker.",
+    ("method",),
+)
+
+
+class MetricsMiddleware:
+    """
+        Middleware ASGI que registra a latência, o status e o tempo de banco de cada requisição HTTP.
+
+        Os registros ficam em memória no próprio worker e são alterados apenas pelo event loop dele, então não há
+        travas: cada requisição custa alguns incrementos em dicionários. Cada worker exporta os seus números em
+        GET /metrics, com o PID no rótulo "worker".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = [500]
+        stats = RequestStats(method, scope["path"])
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing(stats, time.perf_counter() - start).encode("latin-1"))
+                ]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.add((method,), 1)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.add((method,), -1)
+            _request_stats.reset(token)
+
+            route = _route_template(scope)
+            REQUEST_DURATION.observe((method, route, str(status[0])), elapsed)
+            REQUEST_DB_DURATION.observe((method, route), stats.db_time)
+            REQUEST_DB_STATEMENTS.observe((method, route), stats.statements)
+
+
+def _route_template(scope) -> str:
+    """
+        Rota da requisição com os parâmetros no formato do path (ex.: /employees/{employee_id}), definida pelo roteador.
+
+        Nas versões mais recentes do FastAPI, a rota de um APIRouter incluído com prefixo traz apenas o caminho relativo
+        ao prefixo (ex.: /{employee_id}). Nesse caso o prefixo é recuperado do início do caminho da requisição.
+    """
+
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    regex = getattr(route, "path_regex", None)
+    if regex is not None and not regex.match(path):
+        for index in range(1, len(path)):
+            if path[index] == "/" and regex.match(path[index:]):
+                return path[:index] + template
+    return template
+
+def server_timing(stats: RequestStats, elapsed: float) -> str:
+    """
+        Monta o header Server-Timing com o tempo de banco, a quantidade de instruções e o tempo total até o início
+        da resposta, exibidos pelo DevTools dos navegadores. Em respostas em streaming, os valores são os do
+        momento em que os headers foram enviados.
+
+        Args:
+            stats: Estatísticas da requisição.
+            elapsed: Tempo decorrido desde o início da requisição, em segundos.
+
+        Returns:
+            str: Valor do header, por exemplo 'db;dur=12.3;desc="4 queries", app;dur=15.8'.
+    """
+
+    return 'db;dur=%.1f;desc="%s queries", app;dur=%.1f' % (stats.db_time * 1000, stats.statements, elapsed * 1000)
+
+
+def render(*extra: list) -> str:
+    """
+        Exporta as métricas do worker no formato texto do Prometheus.
+
+        Args:
+            extra: Linhas de outras métricas (ex.: do pool de conexões) a serem incluídas.
+
+        Returns:
+            str: Conteúdo para a rota GET /metrics.
+    """
+
+    lines = (REQUEST_DURATION.render() + REQUEST_DB_DURATION.render() + REQUEST_DB_STATEMENTS.render()
+             + REQUESTS_IN_FLIGHT.render())
+    for block in extra:
+        lines.extend(block)
+    return "\n".join(lines) + "\n"
+
+def render_pool_status(pools: Dict[str, dict]) -> list:
+    """
+        Converte os retratos dos pools de conexões (database.pool.pool_status) em métricas do Prometheus.
+
+        Args:
+            pools: Retrato de cada pool, pela identificação usada no rótulo "pool" (ex.: primary, replica).
+
+        Returns:
+            list: Linhas das métricas dos pools.
+    """
+
+    lines = []
+    for key in next(iter(pools.values()), {}):
+        metric, kind = POOL_COUNTERS.get(key, ("db_pool_%s" % key, "gauge"))
+        lines.append("# TYPE %s %s" % (metric, kind))
+        for name, status in pools.items():
+            lines.append('%s{worker="%s",pool="%s"} %r' % (metric, WORKER, name, status[key]))
+    return lines
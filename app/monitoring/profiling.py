@@ -0,0 +1,113 @@
+try:
+    import os
+    import re
+    import hmac
+    import time
+    import uuid
+    import logging
+    from typing import Optional
+    from urllib.parse import parse_qs
+    from app.env import getenv
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+# Token que libera o profiling de uma requisição. Vazio, o middleware nem é registrado (app.main).
+PROFILING_TOKEN = getenv("PROFILING_TOKEN", "")
+PROFILING_DIR = getenv("PROFILING_DIR", "/tmp/profiles")
+# Intervalo entre as amostras do profiler, em segundos
+PROFILING_INTERVAL = float(getenv("PROFILING_INTERVAL", "0.001"))
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_PARAM = "profile"
+
+_UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9]+")
+
+
+def _requested_token(scope) -> Optional[str]:
+    """
+        Token enviado no header X-Profile ou no parâmetro "profile" da URL, ou None se nenhum foi enviado.
+    """
+
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER:
+            return value.decode("latin-1")
+    if PROFILE_QUERY_PARAM.encode() in scope.get("query_string", b""):
+        values = parse_qs(scope["query_string"].decode("latin-1")).get(PROFILE_QUERY_PARAM)
+        if values:
+            return values[0]
+    return None
+
+def _profile_filename(scope) -> str:
+    path = _UNSAFE_CHARACTERS.sub("-", scope["path"]).strip("-") or "root"
+    return "%s-%s-%s-%s.speedscope.json" % (
+        time.strftime("%Y%m%d-%H%M%S"), scope["method"], path[:80], uuid.uuid4().hex[:8])
+
+
+class ProfilingMiddleware:
+    """
+        Middleware ASGI que executa uma requisição sob o profiler por amostragem (pyinstrument) quando ela traz o
+        PROFILING_TOKEN no header X-Profile ou no parâmetro "profile" da URL.
+
+        O profile mostra onde foi o tempo da requisição (consultas e hidratação do ORM, validação dos schemas,
+        serialização do JSON) e é gravado em PROFILING_DIR no formato do speedscope, que exibe o flamegraph. O nome
+        do arquivo volta no header X-Profile-File da resposta. Requisições sem o token seguem direto para a
+        aplicação, e sem PROFILING_TOKEN o middleware nem é registrado.
+
+        O profiler amostra a thread do event loop, então apenas uma requisição é analisada por vez em cada worker.
+        Enquanto ela não termina, outras requisições com o token seguem sem profiling.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.active = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _requested_token(scope)
+        if token is None:
+            await self.app(scope, receive, send)
+            return
+        if not hmac.compare_digest(token.encode(), PROFILING_TOKEN.encode()):
+            _logger.warning("Token de profiling inválido em %s %s" % (scope["method"], scope["path"]))
+            await self.app(scope, receive, send)
+            return
+        if self.active:
+            _logger.warning("Profiling ignorado em %s %s: outra requisição já está em análise neste worker" % (
+                scope["method"], scope["path"]))
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            from pyinstrument import Profiler
+            from pyinstrument.renderers import SpeedscopeRenderer
+        except ImportError:
+            _logger.warning("Profiling indisponível: instale a biblioteca pyinstrument")
+            await self.app(scope, receive, send)
+            return
+
+        filename = _profile_filename(scope)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-file", filename.encode())]
+            await send(message)
+
+        profiler = Profiler(interval=PROFILING_INTERVAL, async_mode="enabled")
+        self.active = True
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            self.active = False
+            os.makedirs(PROFILING_DIR, exist_ok=True)
+            with open(os.path.join(PROFILING_DIR, filename), "w") as file:
+                file.write(profiler.output(renderer=SpeedscopeRenderer()))
+            _logger.info("Profile de %s %s gravado em %s (%.1f ms)" % (
+                scope["method"], scope["path"], filename, profiler.last_session.duration * 1000))
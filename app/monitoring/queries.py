@@ -0,0 +1,82 @@
+try:
+    import re
+    import logging
+    from app.env import getenv
+    from app.monitoring.metrics import current_request_stats
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+# Configuração básica do logger para exibir INFO e outros níveis
+logging.basicConfig(level=logging.INFO)
+_logger = logging.getLogger(__name__)
+
+# Instruções mais demoradas que este limite (em milissegundos) são registradas no log. Com 0 o log é desativado.
+DB_SLOW_QUERY_MS = float(getenv("DB_SLOW_QUERY_MS", "200"))
+
+# Quantidade de execuções da mesma instrução em uma requisição a partir da qual é emitido o aviso de N+1
+DB_N_PLUS_ONE_THRESHOLD = int(getenv("DB_N_PLUS_ONE_THRESHOLD", "10"))
+
+# Tamanho máximo da instrução exibida no log
+MAX_LOGGED_STATEMENT = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def parameters_shape(parameters, executemany: bool = False) -> str:
+    """
+        Descreve o formato dos parâmetros de uma instrução (nomes e tipos), sem expor os valores no log.
+
+        Args:
+            parameters: Parâmetros enviados ao driver.
+            executemany: Se a instrução foi executada para uma lista de parâmetros.
+
+        Returns:
+            str: Formato dos parâmetros, por exemplo "(int, str)" ou "500 x (str, float)".
+    """
+
+    if executemany:
+        if not parameters:
+            return "[]"
+        return "%s x %s" % (len(parameters), parameters_shape(parameters[0]))
+    if isinstance(parameters, dict):
+        return "{%s}" % ", ".join("%s: %s" % (name, type(value).__name__) for name, value in parameters.items())
+    if isinstance(parameters, (list, tuple)):
+        return "(%s)" % ", ".join(type(value).__name__ for value in parameters)
+    return type(parameters).__name__
+
+def _compact(statement: str) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > MAX_LOGGED_STATEMENT:
+        return statement[:MAX_LOGGED_STATEMENT] + "..."
+    return statement
+
+def record_statement(statement: str, parameters, executemany: bool, elapsed: float) -> None:
+    """
+        Registra uma instrução executada: soma o tempo e a contagem na requisição atual, registra no log as
+        instruções lentas e avisa quando a mesma instrução se repete muitas vezes na requisição (padrão N+1).
+
+        A instrução é comparada pelo texto gerado pelo SQLAlchemy, que tem os valores como parâmetros, então
+        buscas iguais com IDs diferentes contam como a mesma instrução.
+
+        Args:
+            statement: SQL enviado ao driver.
+            parameters: Parâmetros da instrução.
+            executemany: Se a instrução foi executada para uma lista de parâmetros.
+            elapsed: Tempo da execução, em segundos.
+    """
+
+    stats = current_request_stats()
+    request = "%s %s" % (stats.method, stats.path) if stats is not None else "fora de requisição"
+
+    if DB_SLOW_QUERY_MS > 0 and elapsed * 1000 >= DB_SLOW_QUERY_MS:
+        _logger.warning("Instrução lenta (%.1f ms) em %s: %s | parâmetros: %s" % (
+            elapsed * 1000, request, _compact(statement), parameters_shape(parameters, executemany)))
+
+    if stats is None:
+        return
+    stats.db_time += elapsed
+    stats.statements += 1
+    count = stats.statement_counts[statement] = stats.statement_counts.get(statement, 0) + 1
+    if count == DB_N_PLUS_ONE_THRESHOLD + 1:
+        _logger.warning("Possível N+1 em %s: a mesma instrução foi executada mais de %s vezes: %s" % (
+            request, DB_N_PLUS_ONE_THRESHOLD, _compact(statement)))
@@ -1,9 +1,10 @@
 try:
-    from fastapi import APIRouter, Depends, HTTPException
-    from sqlalchemy.orm import Session
-    from typing import List
-    from app.database.conn import get_db
-    from app.schemas.department import Department as DepartmentSchema, DepartmentCreate, DepartmentUpdate
+    from fastapi import APIRouter, Depends, HTTPException, Query
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from typing import Optional
+    from app.database.conn import get_db, get_read_db
+    from app.schemas.department import Department as DepartmentSchema, DepartmentCreate, DepartmentUpdate, DepartmentPage
+    from app.schemas.stats import DepartmentStats as DepartmentStatsSchema
     from app.database import crud
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
@@ -13,7 +14,7 @@ router = APIRouter()
 
 # Department Routes
 @router.post("/", response_model=DepartmentSchema)
-def create_department_route(department: DepartmentCreate, db: Session = Depends(get_db)):
+async def create_department_route(department: DepartmentCreate, db: AsyncSession = Depends(get_db)):
     """
         Rota para criar um novo departamento.
 
@@ -25,24 +26,31 @@ def create_department_route(department: DepartmentCreate, db: Session = Depends(
             DepartmentResponse: Lista os detalhes do departamento criado.
     """
 
-    return crud.create_department(db, department)
+    return await crud.create_department(db, department)
 
-@router.get("/", response_model=List[DepartmentSchema])
-def get_all_departments_route(db: Session = Depends(get_db)):
+@router.get("/", response_model=DepartmentPage)
+async def get_all_departments_route(
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE),
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
     """
-    Rota para listar todos os departamentos.
+    Rota para listar os departamentos de forma paginada.
 
     Args:
+        limit: Quantidade máxima de departamentos na página.
+        after_id: Cursor da página, que é o next_cursor retornado pela página anterior.
         db: Sessão do banco de dados.
 
     Returns:
-        List[DepartmentResponse]: Retorna a lista de todos os departamentos inseridos no banco.
+        DepartmentPage: Departamentos da página e o cursor da próxima página.
     """
 
-    return crud.get_all_departments(db)
+    departments, next_cursor = await crud.get_all_departments(db, limit, after_id)
+    return {"items": departments, "next_cursor": next_cursor}
 
 @router.get("/{department_id}", response_model=DepartmentSchema)
-def get_department_route(department_id: int, db: Session = Depends(get_db)):
+async def get_department_route(department_id: int, db: AsyncSession = Depends(get_read_db)):
     """
         Rota para buscar um departamento específico pelo ID.
 
@@ -54,11 +62,47 @@ def get_department_route(department_id: int, db: Session = Depends(get_db)):
             DepartmentResponse: Listar detalhes do departamento correspondente.
     """
 
-    return crud.get_department_by_id(db, department_id)
+    return await crud.get_department_by_id(db, department_id)
+
+@router.get("/{department_id}/stats", response_model=DepartmentStatsSchema)
+async def get_department_stats_route(department_id: int, db: AsyncSession = Depends(get_read_db)):
+    """
+        Rota para buscar os totais de colaboradores ativos, líderes e folha salarial de um departamento.
+
+        Args:
+            department_id: ID do departamento.
+            db: Sessão do banco de dados.
+
+        Returns:
+            DepartmentStats: Totais do departamento.
+    """
+
+    stats = await crud.get_department_stats(db, department_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="Departamento com ID %s não encontrado" % department_id)
+    return stats
+
+@router.post("/{department_id}/archive-employees")
+async def archive_department_employees_route(department_id: int, db: AsyncSession = Depends(get_db)):
+    """
+        Rota para arquivar de uma vez todos os colaboradores ativos de um departamento.
+
+        Args:
+            department_id: ID do departamento.
+            db: Sessão do banco de dados.
+
+        Returns:
+            message: Informativo com a quantidade de colaboradores arquivados.
+    """
+
+    archived = await crud.archive_department_employees(db, department_id)
+    if archived is None:
+        raise HTTPException(status_code=404, detail="Departamento com ID %s não encontrado" % department_id)
+    return {"message": "Colaboradores arquivados com sucesso", "archived": archived}
 
 @router.put("/{department_id}", response_model=DepartmentSchema
 )
-def update_department_route(department_id: int, update_data: DepartmentUpdate, db: Session = Depends(get_db)):
+async def update_department_route(department_id: int, update_data: DepartmentUpdate, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar um departamento específico pelo ID.
 
@@ -71,10 +115,13 @@ def update_department_route(department_id: int, update_data: DepartmentUpdate, d
             DepartmentResponse: Listar detalhes do departamento com os dados atualizados.
     """
 
-    return crud.update_department(db, department_id, update_data)
+    department = await crud.update_department(db, department_id, update_data)
+    if not department:
+        raise HTTPException(status_code=404, detail="Departamento com ID %s não encontrado" % department_id)
+    return department
 
 @router.delete("/{department_id}")
-def delete_department_route(department_id: int, db: Session = Depends(get_db)):
+async def delete_department_route(department_id: int, db: AsyncSession = Depends(get_db)):
     """
         Rota para deletar um departamento específico pelo ID.
 
@@ -86,5 +133,6 @@ def delete_department_route(department_id: int, db: Session = Depends(get_db)):
             message: Informativo que o departamento foi deletado.
     """
 
-    crud.delete_department(db, department_id)
+    if not await crud.delete_department(db, department_id):
+        raise HTTPException(status_code=404, detail="Departamento com ID %s não encontrado" % department_id)
     return {"message": "Departamento deletado com sucesso"}
\ No newline at end of file
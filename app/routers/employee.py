@@ -1,18 +1,85 @@
 try:
-    from fastapi import APIRouter, Depends, HTTPException
-    from sqlalchemy.orm import Session
-    from typing import List
-    from app.database.conn import get_db
-    from app.schemas.employee import Employee as EmployeeSchema, EmployeeCreate, EmployeeUpdate
+    import csv
+    import io
+    import json
+    from fastapi import APIRouter, Depends, HTTPException, Query, Request
+    from fastapi.responses import StreamingResponse
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from typing import AsyncIterator, List, Literal, Optional, Set
+    from app.database.conn import get_db, get_read_db, new_read_session
+    from app.schemas.employee import (
+        Employee as EmployeeSchema,
+        EmployeeCreate,
+        EmployeeUpdate,
+        EmployeePage,
+        EmployeeBulkResult,
+        EmployeeExpanded,
+        EmployeeFilter,
+        EmployeeSearchPage,
+        SalaryAdjustment,
+        SalaryAdjustmentResult,
+    )
     from app.database import crud
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
 router = APIRouter()
 
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _parse_expand(expand: Optional[str]) -> Set[str]:
+    """
+        Converte o parâmetro expand (ex.: "job,department") no conjunto de relacionamentos a serem carregados.
+
+        Raises:
+            HTTPException: Se algum relacionamento informado não puder ser expandido.
+    """
+
+    if not expand:
+        return set()
+    relations = {relation.strip() for relation in expand.split(",") if relation.strip()}
+    invalid = relations - set(crud.EMPLOYEE_RELATIONS)
+    if invalid:
+        raise HTTPException(
+            status_code=422,
+            detail="Não é possível expandir: %s. Opções válidas: %s" % (
+                ", ".join(sorted(invalid)), ", ".join(crud.EMPLOYEE_RELATIONS))
+        )
+    return relations
+
+async def _export_ndjson(request: Request) -> AsyncIterator[str]:
+    """
+        Gera a exportação dos colaboradores no formato NDJSON, um objeto JSON por linha.
+    """
+
+    async with new_read_session(request) as db:
+        async for rows in crud.stream_employees(db):
+            yield "".join("%s\n" % json.dumps(row, ensure_ascii=False) for row in rows)
+
+async def _export_csv(request: Request) -> AsyncIterator[str]:
+    """
+        Gera a exportação dos colaboradores no formato CSV, com o cabeçalho na primeira linha.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=crud.EXPORT_FIELDS)
+    writer.writeheader()
+    async with new_read_session(request) as db:
+        async for rows in crud.stream_employees(db):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
 
 @router.post("/", response_model=EmployeeSchema)
-def create_employee_route(employee: EmployeeCreate, db: Session = Depends(get_db)):
+async def create_employee_route(employee: EmployeeCreate, db: AsyncSession = Depends(get_db)):
     """
         Rota que registra um novo colaborador no banco.
 
@@ -24,42 +91,151 @@ def create_employee_route(employee: EmployeeCreate, db: Session = Depends(get_db
             EmployeeResponse: Detalhamento do colaborador recém-criado.
     """
 
-    return crud.create_employee(db, employee)
+    return await crud.create_employee(db, employee)
+
+@router.post("/bulk", response_model=EmployeeBulkResult)
+async def create_employees_bulk_route(employees: List[EmployeeCreate], db: AsyncSession = Depends(get_db)):
+    """
+        Rota que registra vários colaboradores de uma vez. Registros inválidos são informados individualmente
+        e não impedem a criação dos demais.
+
+        Args:
+            employees: Lista de colaboradores a serem inseridos.
+            db: Sessão do banco de dados.
+
+        Returns:
+            EmployeeBulkResult: Colaboradores criados e os erros de cada registro recusado.
+    """
+
+    if len(employees) > crud.MAX_BULK_SIZE:
+        raise HTTPException(
+            status_code=422,
+            detail="São permitidos no máximo %s colaboradores por requisição" % crud.MAX_BULK_SIZE
+        )
+    created, errors = await crud.create_employees_bulk(db, employees)
+    return {"created": created, "errors": errors}
+
+@router.post("/salary-adjustments", response_model=SalaryAdjustmentResult)
+async def adjust_salaries_route(adjustment: SalaryAdjustment, db: AsyncSession = Depends(get_db)):
+    """
+        Rota que aplica um reajuste percentual ou fixo a todos os colaboradores ativos que atendem aos filtros
+        (departamento, cargo e faixa salarial), em uma única transação. Com dry_run o reajuste é apenas simulado.
+
+        Args:
+            adjustment: Tipo e valor do reajuste, filtros e se é apenas uma simulação.
+            db: Sessão do banco de dados.
+
+        Returns:
+            SalaryAdjustmentResult: Colaboradores afetados e o total da folha antes e depois do reajuste.
+    """
+
+    if adjustment.mode == "percentage" and adjustment.value <= -100:
+        raise HTTPException(status_code=422, detail="O reajuste percentual deve ser maior que -100%")
+    result = await crud.adjust_salaries(db, adjustment)
+    if result is None:
+        raise HTTPException(status_code=422, detail="O reajuste deixaria colaboradores com salário menor ou igual a zero")
+    return result
 
-@router.get("/", response_model=List[EmployeeSchema])
-def get_all_employees_route(db: Session = Depends(get_db)):
+@router.get("/", response_model=EmployeePage)
+async def get_all_employees_route(
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE),
+    after_id: Optional[int] = None,
+    expand: Optional[str] = Query(None, description="Relacionamentos a expandir: job, department"),
+    filters: EmployeeFilter = Depends(),
+    db: AsyncSession = Depends(get_read_db)
+):
     """
-        Rota que faz uma listagem de todos os colaboradores.
+        Rota que faz uma listagem paginada dos colaboradores.
 
         Args:
+            limit: Quantidade máxima de colaboradores na página.
+            after_id: Cursor da página, que é o next_cursor retornado pela página anterior.
+            expand: Relacionamentos separados por vírgula que devem vir preenchidos (job, department).
+            filters: Filtros por department_id, job_id, status, min_salary, max_salary e is_leader.
             db: Sessão do banco de dados.
 
         Returns:
-            List[EmployeeResponse]: Lista de todos os colaboradores.
+            EmployeePage: Colaboradores da página e o cursor da próxima página.
     """
 
-    return crud.get_all_employees(db)
+    employees, next_cursor = await crud.get_all_employees(db, limit, after_id, _parse_expand(expand), filters)
+    return {"items": employees, "next_cursor": next_cursor}
 
-@router.get("/{employee_id}", response_model=EmployeeSchema)
-def get_employee_route(employee_id: int, db: Session = Depends(get_db)):
+@router.get("/search", response_model=EmployeeSearchPage)
+async def search_employees_route(
+    q: str = Query(..., min_length=3, description="Nome, sobrenome ou matrícula, mesmo que incompletos"),
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+        Rota que busca colaboradores pelo nome, sobrenome ou matrícula, tolerando termos incompletos
+        ou com erros de digitação.
+
+        Args:
+            q: Termo pesquisado.
+            limit: Quantidade máxima de colaboradores na página.
+            offset: Posição inicial da página, que é o next_offset retornado pela página anterior.
+            db: Sessão do banco de dados.
+
+        Returns:
+            EmployeeSearchPage: Colaboradores ordenados pela relevância e o offset da próxima página.
+    """
+
+    employees, next_offset = await crud.search_employees(db, q, limit, offset)
+    return {"items": employees, "next_offset": next_offset}
+
+@router.get("/export")
+async def export_employees_route(
+    request: Request,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format")
+):
+    """
+        Rota que exporta todos os colaboradores em streaming, enviando os registros conforme são lidos do banco.
+
+        A sessão do banco é aberta pelo próprio gerador da resposta, pois ela precisa continuar ativa
+        enquanto os dados são enviados ao cliente.
+
+        Args:
+            request: Requisição atual, usada para escolher entre a réplica e o primário.
+            export_format: Formato da exportação, "ndjson" ou "csv".
+
+        Returns:
+            StreamingResponse: Conteúdo da exportação no formato solicitado.
+    """
+
+    content = _export_csv(request) if export_format == "csv" else _export_ndjson(request)
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": "attachment; filename=employees.%s" % export_format}
+    )
+
+@router.get("/{employee_id}", response_model=EmployeeExpanded)
+async def get_employee_route(
+    employee_id: int,
+    expand: Optional[str] = Query(None, description="Relacionamentos a expandir: job, department"),
+    db: AsyncSession = Depends(get_read_db)
+):
     """
         Rota que busca as informações de um colaborador pelo ID.
 
         Args:
             db: Sessão do banco de dados.
             employee_id: ID do colaborador a ser selecionado.
+            expand: Relacionamentos separados por vírgula que devem vir preenchidos (job, department).
 
         Returns:
             EmployeeResponse: Colaborador buscado pelo ID
     """
 
-    employee = crud.get_employee_by_id(db, employee_id)
+    employee = await crud.get_employee_by_id(db, employee_id, _parse_expand(expand))
     if not employee:
         raise HTTPException(status_code=404, detail="Colaborador com ID %s não encontrado" % employee_id)
     return employee
 
 @router.put("/{employee_id}/promote", response_model=EmployeeSchema)
-def promote_employee_route(employee_id: int, update_data: EmployeeUpdate, db: Session = Depends(get_db)):
+async def promote_employee_route(employee_id: int, update_data: EmployeeUpdate, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar ou 'promover' um colaborador.
 
@@ -72,10 +248,13 @@ def promote_employee_route(employee_id: int, update_data: EmployeeUpdate, db: Se
         EmployeeResponse: Retorna os detalhes do colaborador atualizado.
     """
 
-    return crud.promote_employee(db, employee_id, update_data)
+    employee = await crud.promote_employee(db, employee_id, update_data)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Colaborador com ID %s não encontrado" % employee_id)
+    return employee
 
 @router.put("/{employee_id}/archive", response_model=EmployeeSchema)
-def terminate_employee_route(employee_id: int, db: Session = Depends(get_db)):
+async def terminate_employee_route(employee_id: int, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar o status do colaborador para ARQUIVADO.
 
@@ -87,10 +266,13 @@ def terminate_employee_route(employee_id: int, db: Session = Depends(get_db)):
         EmployeeResponse: Retorna os detalhes do colaborador arquivado.
     """
 
-    return crud.terminate_employee(db, employee_id)
+    employee = await crud.terminate_employee(db, employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Colaborador com ID %s não encontrado" % employee_id)
+    return employee
 
 @router.delete("/{employee_id}")
-def delete_employee_route(employee_id: int, db: Session = Depends(get_db)):
+async def delete_employee_route(employee_id: int, db: AsyncSession = Depends(get_db)):
     """
         Rota para excluir um colaborador.
 
@@ -102,5 +284,6 @@ def delete_employee_route(employee_id: int, db: Session = Depends(get_db)):
         message: Apenas retorna mensagem informativa
     """
 
-    crud.delete_employee(db, employee_id)
+    if not await crud.delete_employee(db, employee_id):
+        raise HTTPException(status_code=404, detail="Colaborador com ID %s não encontrado" % employee_id)
     return {"message": "Colaborador deletado com sucesso"}
\ No newline at end of file
@@ -0,0 +1,25 @@
+try:
+    from fastapi import APIRouter
+    from app.database.conn import get_async_engine, get_read_engine
+    from app.database.pool import pool_status
+    from app.schemas.pool import PoolStatus
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+router = APIRouter()
+
+
+@router.get("/pool", response_model=PoolStatus)
+async def get_pool_status_route(replica: bool = False):
+    """
+        Rota interna que mostra o uso do pool de conexões deste worker.
+
+        Args:
+            replica: Mostra o pool das leituras (réplica) em vez do pool do primário.
+
+        Returns:
+            PoolStatus: Conexões em uso, ociosas, em overflow e o tempo acumulado de espera por conexão.
+    """
+
+    engine = get_read_engine() if replica else get_async_engine()
+    return pool_status(engine.pool)
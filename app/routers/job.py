@@ -1,9 +1,10 @@
 try:
-    from fastapi import APIRouter, Depends, HTTPException
-    from sqlalchemy.orm import Session
-    from typing import List
-    from app.database.conn import get_db
-    from app.schemas.job import Job as JobSchema, JobCreate, JobUpdate
+    from fastapi import APIRouter, Depends, HTTPException, Query
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from typing import Optional
+    from app.database.conn import get_db, get_read_db
+    from app.schemas.job import Job as JobSchema, JobCreate, JobUpdate, JobPage
+    from app.schemas.stats import JobStats as JobStatsSchema
     from app.database import crud
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
@@ -13,7 +14,7 @@ router = APIRouter()
 
 # Job Routes
 @router.post("/", response_model=JobSchema)
-def create_job_route(job: JobCreate, db: Session = Depends(get_db)):
+async def create_job_route(job: JobCreate, db: AsyncSession = Depends(get_db)):
     """
         Rota para criar um novo cargo.
 
@@ -25,24 +26,31 @@ def create_job_route(job: JobCreate, db: Session = Depends(get_db)):
             JobResponse: Retorna os detalhes do cargo criado.
     """
 
-    return crud.create_job(db, job)
+    return await crud.create_job(db, job)
 
-@router.get("/", response_model=List[JobSchema])
-def get_all_jobs_route(db: Session = Depends(get_db)):
+@router.get("/", response_model=JobPage)
+async def get_all_jobs_route(
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE),
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
     """
-        Rota para listar todos os cargos.
+        Rota para listar os cargos de forma paginada.
 
         Args:
+        limit: Quantidade máxima de cargos na página.
+        after_id: Cursor da página, que é o next_cursor retornado pela página anterior.
         db: Sessão do banco de dados.
 
         Returns:
-        List[JobResponse]: Retorna a lista de todos os cargos.
+        JobPage: Retorna os cargos da página e o cursor da próxima página.
     """
 
-    return crud.get_all_jobs(db)
+    jobs, next_cursor = await crud.get_all_jobs(db, limit, after_id)
+    return {"items": jobs, "next_cursor": next_cursor}
 
 @router.get("/{job_id}", response_model=JobSchema)
-def get_job_route(job_id: int, db: Session = Depends(get_db)):
+async def get_job_route(job_id: int, db: AsyncSession = Depends(get_read_db)):
     """
         Rota para buscar as informações de um cargo específico pelo ID.
 
@@ -54,10 +62,28 @@ def get_job_route(job_id: int, db: Session = Depends(get_db)):
         JobResponse: Retorna os detalhes do cargo correspondente.
     """
 
-    return crud.get_job_by_id(db, job_id)
+    return await crud.get_job_by_id(db, job_id)
+
+@router.get("/{job_id}/stats", response_model=JobStatsSchema)
+async def get_job_stats_route(job_id: int, db: AsyncSession = Depends(get_read_db)):
+    """
+        Rota para buscar os totais de colaboradores ativos, líderes e folha salarial de um cargo.
+
+        Args:
+        job_id: ID do cargo.
+        db: Sessão do banco de dados.
+
+        Returns:
+        JobStats: Retorna os totais do cargo.
+    """
+
+    stats = await crud.get_job_stats(db, job_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="Cargo com ID %s não encontrado" % job_id)
+    return stats
 
 @router.put("/{job_id}", response_model=JobSchema)
-def update_job_route(job_id: int, update_data: JobUpdate, db: Session = Depends(get_db)):
+async def update_job_route(job_id: int, update_data: JobUpdate, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar as informações de um cargo.
 
@@ -70,10 +96,13 @@ def update_job_route(job_id: int, update_data: JobUpdate, db: Session = Depends(
         JobResponse: Retornar os detalhes do cargo atualizado.
     """
 
-    return crud.update_job(db, job_id, update_data)
+    job = await crud.update_job(db, job_id, update_data)
+    if not job:
+        raise HTTPException(status_code=404, detail="Cargo com ID %s não encontrado" % job_id)
+    return job
 
 @router.delete("/{job_id}")
-def delete_job_route(job_id: int, db: Session = Depends(get_db)):
+async def delete_job_route(job_id: int, db: AsyncSession = Depends(get_db)):
     """
         Rota para excluir um cargo.
 
@@ -85,5 +114,6 @@ def delete_job_route(job_id: int, db: Session = Depends(get_db)):
         message: Retorna mensagem avisando que foi deletado.
     """
 
-    crud.delete_job(db, job_id)
+    if not await crud.delete_job(db, job_id):
+        raise HTTPException(status_code=404, detail="Cargo com ID %s não encontrado" % job_id)
     return {"message": "Cargo deletado com sucesso"}
\ No newline at end of file
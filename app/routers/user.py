@@ -1,9 +1,9 @@
 try:
-    from fastapi import APIRouter, Depends, HTTPException
-    from sqlalchemy.orm import Session
-    from typing import List
-    from app.database.conn import get_db
-    from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+    from fastapi import APIRouter, Depends, HTTPException, Query
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from typing import Optional
+    from app.database.conn import get_db, get_read_db
+    from app.schemas.user import User as UserSchema, UserCreate, UserUpdate, UserPage
     from app.database import crud
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
@@ -16,23 +16,28 @@ router = APIRouter()
     devem ser utilizadas com cautela, apenas por um administrador.
 """
 @router.post("/", response_model=UserSchema)
-def create_user_route(user: UserCreate, db: Session = Depends(get_db)):
-    return crud.create_user(db, user)
-
-@router.get("/", response_model=List[UserSchema])
-def get_all_users_route(db: Session = Depends(get_db)):
-    return crud.get_all_users(db)
+async def create_user_route(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    return await crud.create_user(db, user)
+
+@router.get("/", response_model=UserPage)
+async def get_all_users_route(
+    limit: int = Query(crud.DEFAULT_PAGE_SIZE, ge=1, le=crud.MAX_PAGE_SIZE),
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    users, next_cursor = await crud.get_all_users(db, limit, after_id)
+    return {"items": users, "next_cursor": next_cursor}
 
 @router.get("/{user_id}", response_model=UserSchema)
-def get_user_route(user_id: int, db: Session = Depends(get_db)):
-    return crud.get_user_by_id(db, user_id)
+async def get_user_route(user_id: int, db: AsyncSession = Depends(get_read_db)):
+    return await crud.get_user_by_id(db, user_id)
 
 """
     As funções abaixo não retornam os dados do usuário,
     já que são operações com dados sensíveis e privados.
 """
 @router.put("/{user_id}", response_model=UserSchema)
-def update_user_route(user_id: int, update_data: UserUpdate, db: Session = Depends(get_db)):
+async def update_user_route(user_id: int, update_data: UserUpdate, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar a senha de um usuário.
 
@@ -44,11 +49,12 @@ def update_user_route(user_id: int, update_data: UserUpdate, db: Session = Depen
         Returns:
             message: Retorna apenas uma mensagem avisando que a alteração foi realizada.
     """
-    crud.update_user(db, user_id, update_data)
+    if not await crud.update_user(db, user_id, update_data):
+        raise HTTPException(status_code=404, detail="Usuário com ID %s não encontrado" % user_id)
     return {"message": "Dados atualizados com sucesso."}
 
 @router.put("/{user_id}/password")
-def update_user_password_route(user_id: int, update_data: UserUpdate, db: Session = Depends(get_db)):
+async def update_user_password_route(user_id: int, update_data: UserUpdate, db: AsyncSession = Depends(get_db)):
     """
         Rota para atualizar a senha de um usuário.
 
@@ -61,11 +67,12 @@ def update_user_password_route(user_id: int, update_data: UserUpdate, db: Sessio
             message: Retorna apenas uma mensagem avisando que a senha foi alterada.
     """
 
-    crud.update_user_password(db, user_id, update_data)
+    if not await crud.update_user_password(db, user_id, update_data):
+        raise HTTPException(status_code=404, detail="Usuário com ID %s não encontrado" % user_id)
     return {"message": "Senha alterada com sucesso."}
 
 @router.delete("/{user_id}")
-def delete_user_route(user_id: int, db: Session = Depends(get_db)):
+async def delete_user_route(user_id: int, db: AsyncSession = Depends(get_db)):
     """
         Rota para excluir um usuário.
 
@@ -77,5 +84,6 @@ def delete_user_route(user_id: int, db: Session = Depends(get_db)):
             message: Retorna mensagem avisando que foi excluído
     """
 
-    crud.delete_user(db, user_id)
+    if not await crud.delete_user(db, user_id):
+        raise HTTPException(status_code=404, detail="Usuário com ID %s não encontrado" % user_id)
     return {"message": "Usuário excluído com sucesso."}
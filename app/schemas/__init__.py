@@ -1,4 +1,6 @@
 from . import department
 from . import employee
 from . import job
+from . import pool
+from . import stats
 from . import user
\ No newline at end of file
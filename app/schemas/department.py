@@ -1,6 +1,6 @@
 try:
     from pydantic import BaseModel
-    from typing import Optional
+    from typing import List, Optional
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
@@ -23,4 +23,9 @@ class Department(DepartmentBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class DepartmentPage(BaseModel):
+    items: List[Department]
+    next_cursor: Optional[int] = None
@@ -1,6 +1,8 @@
 try:
     from pydantic import BaseModel
-    from typing import Optional
+    from typing import List, Literal, Optional
+    from app.schemas.department import Department
+    from app.schemas.job import Job
 except Exception as error:
     raise Exception("Erro de biblioteca: %s" % error)
 
@@ -27,8 +29,70 @@ class EmployeeUpdate(BaseModel):
     status: Optional[str] = None
 
 
+class EmployeeFilter(BaseModel):
+    department_id: Optional[int] = None
+    job_id: Optional[int] = None
+    # Por padrão a listagem retorna apenas os colaboradores ativos, "all" inclui os arquivados
+    status: Literal["active", "archived", "all"] = "active"
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    is_leader: Optional[bool] = None
+
+
 class Employee(EmployeeBase):
     id: int
 
     class Config:
         from_attributes = True
+
+
+class EmployeeExpanded(Employee):
+    # Preenchidos apenas quando solicitados pelo parâmetro expand
+    job: Optional[Job] = None
+    department: Optional[Department] = None
+
+
+class EmployeePage(BaseModel):
+    items: List[EmployeeExpanded]
+    next_cursor: Optional[int] = None
+
+
+class EmployeeSearchResult(Employee):
+    score: float
+
+
+class EmployeeSearchPage(BaseModel):
+    items: List[EmployeeSearchResult]
+    next_offset: Optional[int] = None
+
+
+class EmployeeBulkError(BaseModel):
+    index: int
+    detail: str
+
+
+class EmployeeBulkResult(BaseModel):
+    created: List[Employee]
+    errors: List[EmployeeBulkError]
+
+
+class SalaryAdjustmentFilter(BaseModel):
+    department_id: Optional[int] = None
+    job_id: Optional[int] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+
+
+class SalaryAdjustment(BaseModel):
+    mode: Literal["percentage", "fixed"]
+    value: float
+    filters: SalaryAdjustmentFilter = SalaryAdjustmentFilter()
+    dry_run: bool = False
+
+
+class SalaryAdjustmentResult(BaseModel):
+    dry_run: bool
+    affected: int
+    payroll_before: float
+    payroll_after: float
+    payroll_increase: float
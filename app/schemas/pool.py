@@ -0,0 +1,15 @@
+try:
+    from pydantic import BaseModel
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+class PoolStatus(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    wait_time_total: float
+    timeouts: int
@@ -0,0 +1,24 @@
+try:
+    from pydantic import BaseModel
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+
+class StatsBase(BaseModel):
+    active_headcount: int
+    leader_count: int
+    salary_sum: float
+
+
+class DepartmentStats(StatsBase):
+    department_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class JobStats(StatsBase):
+    job_id: int
+
+    class Config:
+        from_attributes = True
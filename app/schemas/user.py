@@ -1,6 +1,6 @@
 try:
     from pydantic import BaseModel
-    from typing import Optional
+    from typing import List, Optional
 except Exception as error:
     raise ImportError("Erro de biblioteca: %s" % error)
 
@@ -25,4 +25,9 @@ class User(UserBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserPage(BaseModel):
+    items: List[User]
+    next_cursor: Optional[int] = None
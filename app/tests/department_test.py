@@ -37,7 +37,7 @@ class TestDepartmentAPI(unittest.TestCase):
 
         response = requests.get("%s/departments" % BASE_URL)
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.json(), list)
+        self.assertIsInstance(response.json().get("items"), list)
 
     def test_get_department_by_id(self):
         """
@@ -49,6 +49,30 @@ class TestDepartmentAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json().get("id"), self.department["id"])
 
+    def test_get_department_stats(self):
+        """
+            Função para testar a API que retorna os totais de um departamento.
+            O departamento criado para os testes ainda não tem colaboradores.
+        """
+
+        response = requests.get("%s/departments/%s/stats" % (BASE_URL, self.department["id"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("active_headcount"), 0)
+        self.assertEqual(response.json().get("salary_sum"), 0)
+
+    def test_archive_department_employees(self):
+        """
+            Função para testar o arquivamento dos colaboradores de um departamento.
+            O departamento criado para os testes não tem colaboradores, e um departamento inexistente retorna 404.
+        """
+
+        response = requests.post("%s/departments/%s/archive-employees" % (BASE_URL, self.department["id"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("archived"), 0)
+
+        response = requests.post("%s/departments/%s/archive-employees" % (BASE_URL, 999999999))
+        self.assertEqual(response.status_code, 404)
+
     def test_update_department(self):
         """
             Função para testar a API de atualização de um departamento.
@@ -1,4 +1,7 @@
 try:
+    import csv
+    import io
+    import json
     import unittest
     import requests
     from faker import Faker
@@ -46,7 +49,74 @@ class TestEmployeeAPI(unittest.TestCase):
 
         response = requests.get("%s/employees" % BASE_URL)
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.json(), list)
+        self.assertIsInstance(response.json().get("items"), list)
+
+    def test_paginate_employees(self):
+        """
+            Função para testar a paginação por cursor da listagem de colaboradores.
+            A segunda página deve começar depois do cursor retornado pela primeira.
+        """
+
+        response = requests.get("%s/employees" % BASE_URL, params={"limit": 1})
+        self.assertEqual(response.status_code, 200)
+        first_page = response.json()
+        self.assertEqual(len(first_page["items"]), 1)
+        self.assertIsNotNone(first_page["next_cursor"])
+
+        response = requests.get(
+            "%s/employees" % BASE_URL,
+            params={"limit": 1, "after_id": first_page["next_cursor"]}
+        )
+        self.assertEqual(response.status_code, 200)
+        for employee in response.json()["items"]:
+            self.assertGreater(employee["id"], first_page["next_cursor"])
+
+    def test_filter_employees(self):
+        """
+            Função para testar os filtros da listagem de colaboradores.
+        """
+
+        params = {"job_id": self.employee["job_id"], "min_salary": 1000, "status": "active"}
+        response = requests.get("%s/employees" % BASE_URL, params=params)
+        self.assertEqual(response.status_code, 200)
+        for employee in response.json()["items"]:
+            self.assertEqual(employee["job_id"], self.employee["job_id"])
+            self.assertGreaterEqual(employee["salary"], 1000)
+
+    def test_search_employees(self):
+        """
+            Função para testar a busca de colaboradores por parte do nome.
+        """
+
+        term = self.employee["last_name"][:4]
+        response = requests.get("%s/employees/search" % BASE_URL, params={"q": term})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.employee["id"], [employee["id"] for employee in response.json()["items"]])
+
+        # A matrícula é encontrada pelo início
+        params = {"q": self.employee["register_number"][:4], "limit": 1000}
+        response = requests.get("%s/employees/search" % BASE_URL, params=params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.employee["id"], [employee["id"] for employee in response.json()["items"]])
+
+        # Termos com menos de 3 caracteres não geram trigramas e não são aceitos
+        response = requests.get("%s/employees/search" % BASE_URL, params={"q": term[:2]})
+        self.assertEqual(response.status_code, 422)
+
+    def test_export_employees(self):
+        """
+            Função para testar a exportação em streaming dos colaboradores nos formatos NDJSON e CSV.
+        """
+
+        response = requests.get("%s/employees/export" % BASE_URL, params={"format": "ndjson"})
+        self.assertEqual(response.status_code, 200)
+        exported_ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+        self.assertIn(self.employee["id"], exported_ids)
+
+        response = requests.get("%s/employees/export" % BASE_URL, params={"format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        self.assertIn(str(self.employee["id"]), [row["id"] for row in rows])
 
     def test_get_employee_by_id(self):
         """
@@ -58,6 +128,75 @@ class TestEmployeeAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json().get("id"), self.employee["id"])
 
+    def test_create_employees_bulk(self):
+        """
+            Função para testar a criação em lote de colaboradores.
+            O registro com cargo inexistente deve ser recusado sem impedir a criação do registro válido.
+        """
+
+        valid_data = {
+            "name": fake.name(),
+            "last_name": fake.last_name(),
+            "register_number": fake.unique.bothify(text="BULK-#######"),
+            "job_id": 1,
+            "salary": fake.pyfloat(left_digits=5, right_digits=2, positive=True, min_value=1500, max_value=10000),
+        }
+        invalid_data = dict(valid_data, register_number=fake.unique.bothify(text="BULK-#######"), job_id=999999)
+
+        response = requests.post("%s/employees/bulk" % BASE_URL, json=[valid_data, invalid_data])
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(len(result["created"]), 1)
+        self.assertEqual(result["created"][0]["register_number"], valid_data["register_number"])
+        self.assertEqual([error["index"] for error in result["errors"]], [1])
+
+        requests.delete("%s/employees/%s" % (BASE_URL, result["created"][0]["id"]))
+
+    def test_salary_adjustment_dry_run(self):
+        """
+            Função para testar a simulação de um reajuste fixo, que deve informar o impacto na folha
+            sem alterar o salário dos colaboradores.
+        """
+
+        payload = {"mode": "fixed", "value": 100, "filters": {"job_id": self.employee["job_id"]}, "dry_run": True}
+        response = requests.post("%s/employees/salary-adjustments" % BASE_URL, json=payload)
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertTrue(result["dry_run"])
+        self.assertGreaterEqual(result["affected"], 1)
+        self.assertAlmostEqual(result["payroll_increase"], result["affected"] * 100, places=2)
+
+        employee = requests.get("%s/employees/%s" % (BASE_URL, self.employee["id"])).json()
+        self.assertEqual(employee["salary"], self.employee["salary"])
+
+        payload = {"mode": "percentage", "value": -100, "dry_run": True}
+        response = requests.post("%s/employees/salary-adjustments" % BASE_URL, json=payload)
+        self.assertEqual(response.status_code, 422)
+
+        # Um reajuste fixo que zera algum salário é recusado, mesmo aplicado de verdade, sem alterar nenhum registro
+        payload = {"mode": "fixed", "value": -self.employee["salary"], "filters": {"job_id": self.employee["job_id"]}}
+        response = requests.post("%s/employees/salary-adjustments" % BASE_URL, json=payload)
+        self.assertEqual(response.status_code, 422)
+        employee = requests.get("%s/employees/%s" % (BASE_URL, self.employee["id"])).json()
+        self.assertEqual(employee["salary"], self.employee["salary"])
+
+    def test_get_employee_expanded(self):
+        """
+            Função para testar a expansão do cargo e do departamento na busca de um colaborador.
+        """
+
+        response = requests.get(
+            "%s/employees/%s" % (BASE_URL, self.employee["id"]),
+            params={"expand": "job,department"}
+        )
+        self.assertEqual(response.status_code, 200)
+        employee = response.json()
+        self.assertEqual(employee["job"]["id"], employee["job_id"])
+        self.assertEqual(employee["department"]["id"], employee["department_id"])
+
+        response = requests.get("%s/employees/%s" % (BASE_URL, self.employee["id"]), params={"expand": "salary"})
+        self.assertEqual(response.status_code, 422)
+
     def test_promote_error_employee(self):
         """
             Função para testar a API de promoção para colaborador.
@@ -84,6 +223,14 @@ class TestEmployeeAPI(unittest.TestCase):
         # Restaurar o cargo e salário original.
         requests.put("%s/employees/%s/promote" % (BASE_URL, self.employee["id"]), json=self.new_employee_data)
 
+    def test_promote_missing_employee(self):
+        """
+            Função para testar a promoção de um colaborador que não existe.
+        """
+
+        response = requests.put("%s/employees/%s/promote" % (BASE_URL, 999999999), json={"salary": 8000.0})
+        self.assertEqual(response.status_code, 404)
+
     def test_archive_employee(self):
         """
             Função para testar a API de demissão/arquivamento de colaboradores.
@@ -93,6 +240,26 @@ class TestEmployeeAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json().get("status"), "Archived")
 
+        # O colaborador arquivado continua disponível na busca pelo ID.
+        response = requests.get("%s/employees/%s" % (BASE_URL, temp_employee["id"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("status"), "Archived")
+
+        # A listagem padrão retorna apenas os ativos, os arquivados só aparecem quando solicitados.
+        params = {"limit": 1, "after_id": temp_employee["id"] - 1}
+        response = requests.get("%s/employees" % BASE_URL, params=params)
+        self.assertNotIn(temp_employee["id"], [employee["id"] for employee in response.json()["items"]])
+        response = requests.get("%s/employees" % BASE_URL, params=dict(params, status="archived"))
+        self.assertIn(temp_employee["id"], [employee["id"] for employee in response.json()["items"]])
+
+        # A matrícula do colaborador arquivado continua reservada, na criação individual e em lote.
+        new_data = dict(self.new_employee_data, register_number=temp_employee["register_number"])
+        response = requests.post("%s/employees" % BASE_URL, json=new_data)
+        self.assertEqual(response.status_code, 500)
+        response = requests.post("%s/employees/bulk" % BASE_URL, json=[new_data])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [0])
+
     def test_delete_employee(self):
         """
             Função para testar a API que deleta os registros do colaborador.
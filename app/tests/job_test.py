@@ -51,12 +51,18 @@ class TestJobAPI(unittest.TestCase):
         
         # Excluir todos os cargos associados ao departamento
         if hasattr(cls, "department") and cls.department.get("id"):
-            jobs_response = requests.get("%s/jobs" % BASE_URL)
-            if jobs_response.status_code == 200:
-                jobs = jobs_response.json()
-                for job in jobs:
+            params = {}
+            while True:
+                jobs_response = requests.get("%s/jobs" % BASE_URL, params=params)
+                if jobs_response.status_code != 200:
+                    break
+                page = jobs_response.json()
+                for job in page["items"]:
                     if job["department_id"] == cls.department["id"]:
                         requests.delete("%s/jobs/%s" % (BASE_URL, job["id"]))
+                if page["next_cursor"] is None:
+                    break
+                params = {"after_id": page["next_cursor"]}
 
         # Excluir o departamento
         if hasattr(cls, "department") and cls.department.get("id"):
@@ -88,7 +94,7 @@ class TestJobAPI(unittest.TestCase):
 
         response = requests.get("%s/jobs" % BASE_URL)
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.json(), list)
+        self.assertIsInstance(response.json().get("items"), list)
 
     def test_get_job_by_id(self):
         """
@@ -99,6 +105,27 @@ class TestJobAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json().get("id"), self.job["id"])
 
+    def test_get_job_stats(self):
+        """
+            Testa os totais de um cargo após criar um colaborador ativo nele.
+        """
+
+        employee_data = {
+            "name": fake.name(),
+            "last_name": fake.last_name(),
+            "register_number": fake.unique.bothify(text="STAT-#######"),
+            "job_id": self.job["id"],
+            "salary": 5000.0,
+        }
+        employee = requests.post("%s/employees" % BASE_URL, json=employee_data).json()
+
+        response = requests.get("%s/jobs/%s/stats" % (BASE_URL, self.job["id"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("active_headcount"), 1)
+        self.assertEqual(response.json().get("salary_sum"), 5000.0)
+
+        requests.delete("%s/employees/%s" % (BASE_URL, employee["id"]))
+
     def test_update_job(self):
         """
             Atualização de um cargo.
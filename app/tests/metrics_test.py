@@ -0,0 +1,43 @@
+try:
+    import unittest
+    import requests
+except Exception as error:
+    raise ImportError("Erro de biblioteca: %s" % error)
+
+BASE_URL = "http://localhost:5555"
+
+
+class TestMetricsAPI(unittest.TestCase):
+
+    def test_get_metrics(self):
+        """
+            Função para testar a rota de métricas no formato do Prometheus.
+            Uma requisição feita antes deve aparecer no histograma com a rota no formato do path.
+        """
+
+        requests.get("%s/departments/%s" % (BASE_URL, 1))
+        response = requests.get("%s/metrics" % BASE_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/plain", response.headers["content-type"])
+        self.assertIn('route="/departments/{department_id}"', response.text)
+        self.assertIn("http_request_db_duration_seconds_count", response.text)
+        self.assertIn("db_pool_checked_out", response.text)
+
+    def test_server_timing_header(self):
+        """
+            Função para testar o header Server-Timing, com o tempo de banco e a quantidade de instruções da requisição.
+        """
+
+        response = requests.get("%s/departments/%s" % (BASE_URL, 1))
+        self.assertIn("server-timing", response.headers)
+        self.assertRegex(response.headers["server-timing"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries", app;dur=[\d.]+$')
+        self.assertIn("http_request_db_statements_count", requests.get("%s/metrics" % BASE_URL).text)
+
+    def test_profiling_invalid_token(self):
+        """
+            Função para testar que uma requisição com token de profiling inválido é atendida normalmente, sem profile.
+        """
+
+        response = requests.get("%s/departments/%s" % (BASE_URL, 1), headers={"X-Profile": "token-invalido"})
+        self.assertNotEqual(response.status_code, 500)
+        self.assertNotIn("x-profile-file", response.headers)
@@ -57,5 +57,17 @@ class TestEmployeeAPI(unittest.TestCase):
         response = requests.put("%s/users/%s/password" % (BASE_URL, self.user_id), json=payload)
         self.assertEqual(response.status_code, 200)
 
+    def test_user_keeps_archived_employee(self):
+        """
+            Função para testar que o usuário continua associado ao colaborador depois do arquivamento
+        """
+
+        response = requests.put("%s/employees/%s/archive" % (BASE_URL, self.employee_id))
+        self.assertEqual(response.status_code, 200)
+
+        response = requests.get("%s/users/%s" % (BASE_URL, self.user_id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("employee_id"), self.employee_id)
+
 if __name__ == "__main__":
     unittest.main()